@@ -28,16 +28,18 @@ For best performance, disable Rosetta on RetroArch:
 This enables native ARM64 + HW rendering = FAST!
 """
 
+import io
 import os
 import platform
-import requests
-import zipfile
 import subprocess
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import shutil
+import struct
+import threading
 from pathlib import Path
-import time
+from concurrent.futures import ThreadPoolExecutor
+import json
 
 # =============================================================================
 # SYSTEM DETECTION — M4 PRO FIX v1.3
@@ -54,22 +56,83 @@ IS_M4 = IS_APPLE_SILICON  # M4 is arm64
 print(f"[Setup] OS: {platform.system()} {platform.release()} ({MACHINE})")
 print(f"[Setup] Apple Silicon: {IS_APPLE_SILICON}")
 
+# (path, st_mtime_ns, st_size) -> arch, so repeat checks skip the header read
+_ARCH_CACHE = {}
+
+# Mach-O cputype -> lipo arch name (CPU_ARCH_ABI64 = 0x01000000)
+_MACHO_CPU_TYPES = {
+    7: "i386",
+    0x01000007: "x86_64",
+    12: "arm",
+    0x0100000C: "arm64",
+}
+
+def _read_macho_archs(binary_path):
+    """
+    Read the architectures of a Mach-O binary straight from its header.
+    Returns a list like lipo -archs, or None if the magic isn't Mach-O.
+    """
+    with open(binary_path, "rb") as f:
+        header = f.read(4096)
+    if len(header) < 8:
+        return None
+    
+    magic = struct.unpack(">I", header[:4])[0]
+    
+    # Fat (universal) headers are always big-endian
+    if magic in (0xCAFEBABE, 0xCAFEBABF):
+        entry_size = 20 if magic == 0xCAFEBABE else 32
+        nfat_arch = struct.unpack(">I", header[4:8])[0]
+        archs = []
+        for i in range(nfat_arch):
+            offset = 8 + i * entry_size
+            if offset + 4 > len(header):
+                break
+            cputype = struct.unpack(">I", header[offset:offset + 4])[0]
+            archs.append(_MACHO_CPU_TYPES.get(cputype, hex(cputype)))
+        return archs
+    
+    # Thin binaries: cputype follows the magic, in the file's byte order
+    if magic in (0xFEEDFACE, 0xFEEDFACF):
+        cputype = struct.unpack(">I", header[4:8])[0]
+    elif magic in (0xCEFAEDFE, 0xCFFAEDFE):
+        cputype = struct.unpack("<I", header[4:8])[0]
+    else:
+        return None
+    return [_MACHO_CPU_TYPES.get(cputype, hex(cputype))]
+
 def get_binary_arch(binary_path):
     """
     Detect actual architecture of a macOS binary.
     Returns 'arm64', 'x86_64', 'universal', or None.
+    Results are cached per (path, mtime, size).
     """
-    if SYS_OS != "darwin" or not Path(binary_path).exists():
+    if SYS_OS != "darwin":
         return None
     
     try:
-        result = subprocess.run(
-            ["lipo", "-archs", str(binary_path)],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        archs = result.stdout.strip().split()
+        st = os.stat(binary_path)
+    except OSError:
+        return None
+    key = (str(binary_path), st.st_mtime_ns, st.st_size)
+    if key in _ARCH_CACHE:
+        return _ARCH_CACHE[key]
+    
+    _ARCH_CACHE[key] = arch = _detect_arch(binary_path)
+    return arch
+
+def _detect_arch(binary_path):
+    """Parse the Mach-O header, falling back to lipo -archs (uncached)"""
+    try:
+        archs = _read_macho_archs(binary_path)
+        if archs is None:
+            result = subprocess.run(
+                ["lipo", "-archs", str(binary_path)],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            archs = result.stdout.strip().split()
         print(f"[Arch] {binary_path}: {archs}")
         
         if "arm64" in archs and "x86_64" in archs:
@@ -83,51 +146,98 @@ def get_binary_arch(binary_path):
         print(f"[Arch] Detection failed: {e}")
         return None
 
+def _defaults_read(*args):
+    """Run `defaults read ...`, returning the CompletedProcess or None"""
+    try:
+        return subprocess.run(
+            ["defaults", "read", *args],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except:
+        return None
+
+# Startup results that only change when RetroArch or the core changes:
+#   ra_mtime, ra_size, ra_binary_arch — RetroArch binary's Mach-O arch
+#   core_mtime, core_size, core_needed, core_arch, core_valid — core check
+#   quarantine_cleared                — {path: mtime} already dequarantined
+STARTUP_CACHE_FILE = HOME / "Library/Application Support/RetroArch/.cats_startup_cache.json"
+_startup_cache = None
+
+def _load_cache():
+    """Return the startup cache dict, reading it from disk on first use"""
+    global _startup_cache
+    if _startup_cache is None:
+        try:
+            cache = json.loads(STARTUP_CACHE_FILE.read_text())
+            _startup_cache = cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            _startup_cache = {}
+    return _startup_cache
+
+def _save_cache(cache):
+    try:
+        STARTUP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        STARTUP_CACHE_FILE.write_text(json.dumps(cache))
+    except OSError as e:
+        print(f"[Cache] Could not save startup cache: {e}")
+
+def _reset_cache():
+    """Forget every cached startup result (memory and disk)"""
+    global _startup_cache
+    _startup_cache = {}
+    STARTUP_CACHE_FILE.unlink(missing_ok=True)
+
 def get_retroarch_running_arch():
     """
     Detect which architecture RetroArch will actually run as.
     On Apple Silicon, universal binaries run as arm64 unless forced to Rosetta.
+    Only the binary's own architecture is cached in STARTUP_CACHE_FILE (until
+    the binary changes): the Rosetta preferences can be toggled in Finder
+    without touching the binary, so they are read fresh every time.
     """
     ra_exe = Path("/Applications/RetroArch.app/Contents/MacOS/RetroArch")
     
-    if not ra_exe.exists():
+    try:
+        st = ra_exe.stat()
+    except OSError:
         return MACHINE  # fallback to system arch
     
-    binary_arch = get_binary_arch(ra_exe)
+    cache = _load_cache()
+    if (cache.get("ra_mtime") == st.st_mtime_ns and cache.get("ra_size") == st.st_size
+            and "ra_binary_arch" in cache):
+        binary_arch = cache["ra_binary_arch"]
+    else:
+        binary_arch = get_binary_arch(ra_exe)
+        cache.update(ra_mtime=st.st_mtime_ns, ra_size=st.st_size, ra_binary_arch=binary_arch)
+        _save_cache(cache)
     
+    return _detect_running_arch(binary_arch)
+
+def _detect_running_arch(binary_arch):
+    """Apply the Rosetta settings to the binary's architecture (uncached)"""
     if binary_arch == "universal":
         # Check if app is set to "Open using Rosetta"
         # This is stored in com.apple.LaunchServices plist, but easier to check
         # by looking at the app's Info.plist for LSArchitecturePriority
         # OR just check if there's a Rosetta marker
-        
         info_plist = Path("/Applications/RetroArch.app/Contents/Info.plist")
-        try:
-            result = subprocess.run(
-                ["defaults", "read", str(info_plist), "LSArchitecturePriority"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if "x86_64" in result.stdout:
-                print("[Arch] RetroArch set to prefer x86_64 (Rosetta)")
-                return "x86_64"
-        except:
-            pass
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            priority_job = pool.submit(_defaults_read, str(info_plist), "LSArchitecturePriority")
+            rosetta_job = pool.submit(_defaults_read, "com.apple.rosetta", "RetroArch")
+            priority = priority_job.result()
+            rosetta = rosetta_job.result()
+        
+        if priority and "x86_64" in priority.stdout:
+            print("[Arch] RetroArch set to prefer x86_64 (Rosetta)")
+            return "x86_64"
         
         # Check system preference for this app
-        try:
-            result = subprocess.run(
-                ["defaults", "read", "com.apple.rosetta", "RetroArch"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                print("[Arch] RetroArch has Rosetta preference set")
-                return "x86_64"
-        except:
-            pass
+        if rosetta and rosetta.returncode == 0:
+            print("[Arch] RetroArch has Rosetta preference set")
+            return "x86_64"
         
         # Universal binary on Apple Silicon defaults to arm64
         if IS_APPLE_SILICON:
@@ -148,12 +258,23 @@ RETROARCH_ARCH = None  # Will be set after paths are configured
 # PLATFORM PATHS — M4 PRO OPTIMIZED
 # =============================================================================
 
+NIGHTLY_URL = "https://buildbot.libretro.com/nightly"
+
+def _build_core_urls(arch):
+    """Core download URLs for this OS and the given architecture"""
+    if SYS_OS == "windows":
+        url = f"{NIGHTLY_URL}/windows/{arch}/latest/mupen64plus_next_libretro.dll.zip"
+    elif SYS_OS == "darwin":
+        url = f"{NIGHTLY_URL}/apple/osx/{arch}/latest/mupen64plus_next_libretro.dylib.zip"
+    else:
+        url = f"{NIGHTLY_URL}/linux/{arch}/latest/mupen64plus_next_libretro.so.zip"
+    return [("mupen64plus_next", url)]
+
 def get_platform_paths():
     global RETROARCH_ARCH
     
     ra_version = "1.22.1"
     base_url = f"https://buildbot.libretro.com/stable/{ra_version}/"
-    nightly = "https://buildbot.libretro.com/nightly"
 
     if SYS_OS == "windows":
         appdata = Path(os.environ.get("APPDATA", HOME / "AppData" / "Roaming"))
@@ -163,9 +284,6 @@ def get_platform_paths():
         ra_exe = retroarch_dir / "retroarch.exe"
         arch = "x86_64" if "64" in MACHINE else "x86"
         ra_url = f"{base_url}windows/{arch}/RetroArch.7z"
-        core_urls = [
-            ("mupen64plus_next", f"{nightly}/windows/{arch}/latest/mupen64plus_next_libretro.dll.zip")
-        ]
         core_ext = ".dll"
 
     elif SYS_OS == "darwin":
@@ -183,9 +301,6 @@ def get_platform_paths():
         arch = RETROARCH_ARCH if RETROARCH_ARCH else ("arm64" if IS_APPLE_SILICON else "x86_64")
         
         ra_url = f"{base_url}apple/osx/universal/RetroArch_Metal.dmg"
-        core_urls = [
-            ("mupen64plus_next", f"{nightly}/apple/osx/{arch}/latest/mupen64plus_next_libretro.dylib.zip")
-        ]
         core_ext = ".dylib"
 
     else:  # Linux
@@ -195,9 +310,6 @@ def get_platform_paths():
         ra_exe = retroarch_dir / "retroarch"
         arch = "x86_64"
         ra_url = f"{base_url}linux/{arch}/RetroArch.7z"
-        core_urls = [
-            ("mupen64plus_next", f"{nightly}/linux/{arch}/latest/mupen64plus_next_libretro.so.zip")
-        ]
         core_ext = ".so"
 
     return {
@@ -207,9 +319,10 @@ def get_platform_paths():
         "ra_exe": Path(ra_exe),
         "ra_app": retroarch_dir / "RetroArch.app" if SYS_OS == "darwin" else None,
         "ra_url": ra_url,
-        "core_urls": core_urls,
+        "core_urls": _build_core_urls(arch),
         "core_ext": core_ext,
-        "core_arch": arch  # Store the arch we're using for cores
+        "core_arch": arch,  # Store the arch we're using for cores
+        "n64_core_path": str(cores_dir / f"mupen64plus_next_libretro{core_ext}")
     }
 
 PATHS = get_platform_paths()
@@ -217,26 +330,91 @@ PATHS["config_dir"].mkdir(parents=True, exist_ok=True)
 PATHS["cores_dir"].mkdir(parents=True, exist_ok=True)
 
 ROM_DIR = HOME / "Documents/ROMs/N64"
+ROM_EXTENSIONS = {".z64", ".n64", ".v64"}
 ROM_DIR.mkdir(parents=True, exist_ok=True)
 
 # =============================================================================
 # MACOS QUARANTINE FIX — CRITICAL FOR M4
 # =============================================================================
 
+# (path, st_mtime_ns) pairs already dequarantined this session
+_quarantine_cleared = set()
+_xattr_remover = None
+
+def _get_xattr_remover():
+    """
+    Return a function that drops com.apple.quarantine from one path.
+    os.removexattr only exists on Linux, so on macOS call libc directly.
+    """
+    global _xattr_remover
+    if _xattr_remover:
+        return _xattr_remover
+    
+    if hasattr(os, "removexattr"):
+        def remove(p):
+            os.removexattr(p, "com.apple.quarantine", follow_symlinks=False)
+    else:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        c_removexattr = libc.removexattr
+        c_removexattr.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        c_removexattr.restype = ctypes.c_int
+        XATTR_NOFOLLOW = 0x0001
+        
+        def remove(p):
+            if c_removexattr(os.fsencode(p), b"com.apple.quarantine", XATTR_NOFOLLOW) != 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), p)
+    
+    _xattr_remover = remove
+    return remove
+
+def _remove_xattr_tree(path, remove):
+    """Equivalent of `xattr -rd com.apple.quarantine path`, without the fork"""
+    paths = [path]
+    if os.path.isdir(path) and not os.path.islink(path):
+        for root, dirs, files in os.walk(path):
+            paths.extend(os.path.join(root, name) for name in dirs)
+            paths.extend(os.path.join(root, name) for name in files)
+    for p in paths:
+        try:
+            remove(p)
+        except OSError:
+            pass  # attribute not set (ENOATTR) or unreadable entry
+
 def remove_quarantine(path):
-    """Remove macOS quarantine attribute from downloaded files"""
-    if SYS_OS != "darwin":
+    """
+    Remove macOS quarantine attribute from downloaded files.
+    Runs once per path and mtime; remembered across runs in STARTUP_CACHE_FILE.
+    Replaced by a no-op at import time on other platforms.
+    """
+    path = str(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return
+    if (path, mtime) in _quarantine_cleared:
+        return
+    
+    cache = _load_cache()
+    cleared = cache.get("quarantine_cleared")
+    if not isinstance(cleared, dict):
+        cleared = cache["quarantine_cleared"] = {}
+    if cleared.get(path) == mtime:
+        _quarantine_cleared.add((path, mtime))
         return
     
     try:
-        subprocess.run(
-            ["xattr", "-rd", "com.apple.quarantine", str(path)],
-            capture_output=True,
-            timeout=10
-        )
+        _remove_xattr_tree(path, _get_xattr_remover())
         print(f"[Quarantine] Removed from: {path}")
     except Exception as e:
         print(f"[Quarantine] Warning: {e}")
+        return
+    
+    _quarantine_cleared.add((path, mtime))
+    cleared[path] = mtime
+    _save_cache(cache)
 
 def fix_core_permissions(core_path):
     """Ensure core is executable and not quarantined"""
@@ -259,49 +437,119 @@ def verify_core_arch(core_path):
     """
     Verify that core architecture matches RetroArch architecture.
     Returns (is_valid, core_arch, needed_arch)
+    A missing core reports core_arch=None. The verdict for an unchanged
+    core is reused from STARTUP_CACHE_FILE across runs.
     """
-    if SYS_OS != "darwin" or not core_path or not core_path.exists():
+    if SYS_OS != "darwin" or not core_path:
         return True, None, None
     
-    core_arch = get_binary_arch(core_path)
     needed_arch = RETROARCH_ARCH or ("arm64" if IS_APPLE_SILICON else "x86_64")
     
+    try:
+        st = os.stat(core_path)
+    except OSError:
+        return True, None, needed_arch
+    
+    cache = _load_cache()
+    if (cache.get("core_mtime") == st.st_mtime_ns and cache.get("core_size") == st.st_size
+            and cache.get("core_needed") == needed_arch and "core_valid" in cache):
+        return cache["core_valid"], cache.get("core_arch"), needed_arch
+    
+    core_arch = get_binary_arch(core_path)
+    
     print(f"[Core Verify] Core arch: {core_arch}, RetroArch needs: {needed_arch}")
     
+    is_valid = True
     if core_arch and needed_arch:
-        if core_arch == needed_arch:
-            return True, core_arch, needed_arch
-        elif core_arch == "universal":
-            return True, core_arch, needed_arch  # Universal works for both
-        else:
+        # Universal works for both
+        if core_arch != needed_arch and core_arch != "universal":
             print(f"[Core Verify] ⚠ MISMATCH! Core is {core_arch}, RetroArch needs {needed_arch}")
-            return False, core_arch, needed_arch
+            is_valid = False
+    
+    cache.update(core_mtime=st.st_mtime_ns, core_size=st.st_size,
+                 core_needed=needed_arch, core_arch=core_arch, core_valid=is_valid)
+    _save_cache(cache)
     
-    return True, core_arch, needed_arch
+    return is_valid, core_arch, needed_arch
 
 def find_n64_core():
-    for name in ["mupen64plus_next_libretro"]:
-        core = PATHS["cores_dir"] / f"{name}{PATHS['core_ext']}"
-        if core.exists():
-            print(f"[Core] Found: {core}")
-            fix_core_permissions(core)
-            return core
-    return None
+    core = PATHS["n64_core_path"]
+    if not os.path.exists(core):
+        return None
+    print(f"[Core] Found: {core}")
+    core = Path(core)
+    fix_core_permissions(core)
+    return core
 
 # =============================================================================
 # INSTALLERS
 # =============================================================================
 
-def download(url, path):
-    if path.exists():
-        return True
+_SESSION = None
+
+def _get_session():
+    """Shared keep-alive session, created on first download"""
+    global _SESSION
+    if _SESSION is None:
+        import requests  # deferred: only needed when a download actually happens
+        _SESSION = requests.Session()
+    return _SESSION
+
+HYDRA_PARTS = 4  # parallel byte-range streams per download
+
+def download_bytes(url):
+    """
+    Download a file straight into memory.
+    Uses HYDRA_PARTS parallel range requests when the server supports them,
+    otherwise a single stream.
+    """
+    session = _get_session()
     print(f"[Download] {url}")
-    r = requests.get(url, stream=True, timeout=60)
+    
+    try:
+        head = session.head(url, allow_redirects=True, timeout=30)
+        size = int(head.headers.get("Content-Length", 0))
+        ranged = head.headers.get("Accept-Ranges") == "bytes"
+        url = head.url  # skip the redirect on every part
+    except Exception:
+        size, ranged = 0, False
+    
+    if ranged and size >= HYDRA_PARTS * 65536:
+        data = _download_ranges(url, size)
+        if data is not None:
+            return io.BytesIO(data)
+        print("[Download] Range requests refused, using single stream")
+    
+    r = session.get(url, stream=True, timeout=60)
     r.raise_for_status()
-    with open(path, "wb") as f:
+    buf = io.BytesIO()
+    for chunk in r.iter_content(65536):
+        buf.write(chunk)
+    buf.seek(0)
+    return buf
+
+def _download_ranges(url, size):
+    """Fetch `size` bytes as HYDRA_PARTS concurrent ranges; None if unsupported"""
+    session = _get_session()
+    data = bytearray(size)
+    step = -(-size // HYDRA_PARTS)
+    
+    def fetch(start):
+        end = min(start + step, size) - 1
+        r = session.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=60)
+        r.raise_for_status()
+        if r.status_code != 206:
+            r.close()
+            return False
+        pos = start
         for chunk in r.iter_content(65536):
-            f.write(chunk)
-    return True
+            data[pos:pos + len(chunk)] = chunk
+            pos += len(chunk)
+        return pos == end + 1
+    
+    with ThreadPoolExecutor(max_workers=HYDRA_PARTS) as pool:
+        ok = all(pool.map(fetch, range(0, size, step)))
+    return data if ok else None
 
 def install_core():
     core = find_n64_core()
@@ -319,34 +567,19 @@ def install_core():
 
 def install_core_forced(arch):
     """Force download core for specific architecture"""
-    nightly = "https://buildbot.libretro.com/nightly"
-    
-    if SYS_OS == "darwin":
-        url = f"{nightly}/apple/osx/{arch}/latest/mupen64plus_next_libretro.dylib.zip"
-    elif SYS_OS == "windows":
-        url = f"{nightly}/windows/{arch}/latest/mupen64plus_next_libretro.dll.zip"
-    else:
-        url = f"{nightly}/linux/{arch}/latest/mupen64plus_next_libretro.so.zip"
+    url = _build_core_urls(arch)[0][1]
     
     print(f"[Core] Downloading {arch} core from: {url}")
     
     try:
-        zip_path = PATHS["cores_dir"] / "mupen64plus_next.zip"
-        
-        # Delete existing zip if any
-        if zip_path.exists():
-            zip_path.unlink()
-        
-        download(url, zip_path)
+        # Extract from memory — the zip never touches disk
+        import zipfile
+        with zipfile.ZipFile(download_bytes(url)) as z:
+            members = [n for n in z.namelist() if n.endswith(PATHS["core_ext"])]
+            z.extractall(PATHS["cores_dir"], members=members)
         
-        with zipfile.ZipFile(zip_path) as z:
-            z.extractall(PATHS["cores_dir"])
-        zip_path.unlink()
-        
-        core = find_n64_core()
+        core = find_n64_core()  # also fixes permissions
         if core:
-            fix_core_permissions(core)
-            
             # Verify the new core
             is_valid, core_arch, needed_arch = verify_core_arch(core)
             if is_valid:
@@ -365,6 +598,31 @@ def install_core_forced(arch):
 # ROM LAUNCHER — M4 PRO FIX
 # =============================================================================
 
+# Core options that force software rendering (works under Rosetta)
+CORE_OPTIONS = '''mupen64plus-rdp-plugin = "angrylion"
+mupen64plus-rsp-plugin = "hle"
+mupen64plus-43screensize = "640x480"
+mupen64plus-aspect = "4:3"
+mupen64plus-cpucore = "dynamic_recompiler"
+'''
+
+def write_core_options(opts_file, content):
+    """
+    Atomically write a core options file.
+    Returns False without touching the disk if it already has this content.
+    """
+    target = content.encode()
+    try:
+        if opts_file.read_bytes() == target:
+            return False
+    except FileNotFoundError:
+        opts_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    tmp = opts_file.with_suffix(".opt.tmp")
+    tmp.write_bytes(target)
+    os.replace(tmp, opts_file)
+    return True
+
 def launch_rom_macos(rom_path, core_path):
     """
     macOS-specific launch that doesn't quit immediately.
@@ -389,33 +647,23 @@ def launch_rom_macos(rom_path, core_path):
     # FIX v1.3.3: Create core options file to disable HW rendering
     # This forces software rendering which works under Rosetta
     if config_dir:
-        core_opts_dir = config_dir / "config" / "Mupen64Plus-Next"
-        core_opts_dir.mkdir(parents=True, exist_ok=True)
-        core_opts_file = core_opts_dir / "Mupen64Plus-Next.opt"
-        
-        # Write core options to force software rendering (works under Rosetta)
-        core_opts = '''mupen64plus-rdp-plugin = "angrylion"
-mupen64plus-rsp-plugin = "hle"
-mupen64plus-43screensize = "640x480"
-mupen64plus-aspect = "4:3"
-mupen64plus-cpucore = "dynamic_recompiler"
-'''
+        core_opts_file = config_dir / "config" / "Mupen64Plus-Next" / "Mupen64Plus-Next.opt"
         try:
-            core_opts_file.write_text(core_opts)
-            print(f"[Config] Created core options: {core_opts_file}")
+            if write_core_options(core_opts_file, CORE_OPTIONS):
+                print(f"[Config] Created core options: {core_opts_file}")
             print("[Config] Using Angrylion software renderer (Rosetta compatible)")
         except Exception as e:
             print(f"[Config] Warning: Could not write core options: {e}")
     
     # Ensure ROM path is absolute and quoted properly
-    rom_path = Path(rom_path).resolve()
-    core_path = Path(core_path).resolve()
+    rom_path = os.path.abspath(rom_path)
+    core_path = os.path.abspath(core_path)
     
     cmd = [
         str(ra_exe),
-        "-L", str(core_path),
+        "-L", core_path,
         "--verbose",
-        str(rom_path)
+        rom_path
     ]
     
     print("[Launch macOS]", " ".join(cmd))
@@ -424,14 +672,12 @@ mupen64plus-cpucore = "dynamic_recompiler"
         env = os.environ.copy()
         env["DISPLAY"] = env.get("DISPLAY", ":0")
         
-        proc = subprocess.Popen(
+        subprocess.Popen(
             cmd,
             env=env,
         )
         
-        time.sleep(0.5)
-        bring_to_front()
-        
+        # The GUI schedules bring_to_front() once the window has had time to open
         return True, None
         
     except Exception as e:
@@ -439,9 +685,6 @@ mupen64plus-cpucore = "dynamic_recompiler"
 
 def bring_to_front():
     """Use AppleScript to bring RetroArch window to front"""
-    if SYS_OS != "darwin":
-        return
-    
     script = '''
     tell application "RetroArch"
         activate
@@ -499,10 +742,19 @@ def launch_rom(rom_path, core_path):
         return False, f"ROM not found: {rom_path}"
 
     # M4 Pro fix: use macOS-specific launcher
-    if SYS_OS == "darwin":
-        return launch_rom_macos(rom_path, core_path)
-    else:
-        return launch_rom_direct(rom_path, core_path)
+    return _launch_rom_platform(rom_path, core_path)
+
+def _noop(*args):
+    """Stand-in for macOS-only helpers on other platforms"""
+    return None
+
+# Bind the platform-specific helpers once instead of branching on every call
+if SYS_OS == "darwin":
+    _launch_rom_platform = launch_rom_macos
+else:
+    remove_quarantine = _noop
+    bring_to_front = _noop
+    _launch_rom_platform = launch_rom_direct
 
 # =============================================================================
 # GUI — M4 PRO EDITION
@@ -519,6 +771,7 @@ class CatsN64EMU(tk.Tk):
             self.tk.call('tk', 'scaling', 2.0)
 
         self.core = None
+        self._installing = False  # a core install worker is running
         self.setup_gui()
         self.after(100, self.init_core)  # Async core init
 
@@ -551,8 +804,17 @@ class CatsN64EMU(tk.Tk):
 
     def init_core(self):
         self.status.config(text="Loading N64 core...")
-        self.update()
-        self.core = install_core()
+        # install_core may download; keep the Tk loop free while it runs
+        self._installing = True
+        threading.Thread(target=self._install_core_worker, daemon=True).start()
+    
+    def _install_core_worker(self):
+        core = install_core()
+        self.after(0, lambda c=core: self._on_core_ready(c))
+    
+    def _on_core_ready(self, core):
+        self._installing = False
+        self.core = core
         
         if self.core:
             chip = "M4 Pro" if IS_M4 else "Intel"
@@ -563,16 +825,21 @@ class CatsN64EMU(tk.Tk):
         self.load_roms()
 
     def load_roms(self):
-        self.list.delete(*self.list.get_children())
-        
-        extensions = ("*.z64", "*.n64", "*.v64")
-        roms = []
-        for ext in extensions:
-            roms.extend(ROM_DIR.glob(ext))
-        
-        for rom in sorted(roms):
-            size_mb = rom.stat().st_size / (1024 * 1024)
-            self.list.insert("", "end", values=(rom.name, f"{size_mb:.1f} MB"))
+        # One directory pass; DirEntry.stat() reuses the dirent data
+        with os.scandir(ROM_DIR) as it:
+            roms = [(e.name, e.stat().st_size) for e in it
+                    if e.is_file() and os.path.splitext(e.name)[1].lower() in ROM_EXTENSIONS]
+        roms.sort()
+        
+        # Unmap the list during the bulk update so Tk lays it out once
+        self.list.pack_forget()
+        try:
+            self.list.delete(*self.list.get_children())
+            for name, size in roms:
+                size_mb = size / (1024 * 1024)
+                self.list.insert("", "end", values=(name, f"{size_mb:.1f} MB"))
+        finally:
+            self.list.pack(fill=tk.BOTH, expand=True, padx=5, pady=5, before=self.status)
         
         count = len(roms)
         self.status.config(text=f"Found {count} ROM(s) in {ROM_DIR}")
@@ -589,16 +856,27 @@ class CatsN64EMU(tk.Tk):
         self.load_roms()
 
     def reinstall_core(self):
+        # Ignore clicks while an install is already writing the core file
+        if self._installing:
+            return
+        self._installing = True
+        
         self.status.config(text="Downloading core...")
-        self.update()
+        self.update_idletasks()
         
-        # Delete existing core
-        for name in ["mupen64plus_next_libretro"]:
-            core = PATHS["cores_dir"] / f"{name}{PATHS['core_ext']}"
-            if core.exists():
-                core.unlink()
+        # Delete existing core, dropping our reference to it first
+        self.core = None
+        Path(PATHS["n64_core_path"]).unlink(missing_ok=True)
         
-        self.core = install_core()
+        threading.Thread(target=self._reinstall_core_worker, daemon=True).start()
+    
+    def _reinstall_core_worker(self):
+        core = install_core()
+        self.after(0, lambda c=core: self._on_core_reinstalled(c))
+    
+    def _on_core_reinstalled(self, core):
+        self._installing = False
+        self.core = core
         
         if self.core:
             self.status.config(text=f"✓ Core installed: {self.core.name}")
@@ -609,6 +887,10 @@ class CatsN64EMU(tk.Tk):
         """Fix architecture mismatch by removing Rosetta preference and redownloading correct core"""
         global RETROARCH_ARCH, PATHS  # Must be at top of function!
         
+        # It deletes and redownloads the core too; not while a worker is
+        if self._installing:
+            return
+        
         self.status.config(text="Fixing Rosetta issue...")
         self.update()
         
@@ -639,15 +921,17 @@ class CatsN64EMU(tk.Tk):
             pass
         
         # Step 3: Delete existing cores
-        for name in ["mupen64plus_next_libretro"]:
-            core = PATHS["cores_dir"] / f"{name}{PATHS['core_ext']}"
-            if core.exists():
-                core.unlink()
-                print(f"[Rosetta] Deleted old core: {core}")
+        Path(PATHS["n64_core_path"]).unlink(missing_ok=True)
+        print(f"[Rosetta] Deleted old core: {PATHS['n64_core_path']}")
+        _ARCH_CACHE.clear()
+        _reset_cache()
         
         # Step 4: Re-detect architecture
         RETROARCH_ARCH = get_retroarch_running_arch()
-        PATHS = get_platform_paths()
+        if RETROARCH_ARCH:
+            # Only the arch-dependent fields change; avoid re-probing everything
+            PATHS["core_arch"] = RETROARCH_ARCH
+            PATHS["core_urls"] = _build_core_urls(RETROARCH_ARCH)
         
         print(f"[Rosetta] New detected arch: {RETROARCH_ARCH}")
         
@@ -689,6 +973,7 @@ class CatsN64EMU(tk.Tk):
         
         if ok:
             self.status.config(text=f"▶ Playing: {rom_name}")
+            self.after(500, bring_to_front)
         else:
             self.status.config(text=f"✗ Error: {err}")
             messagebox.showerror("Launch Error", err)
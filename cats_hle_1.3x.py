@@ -30,16 +30,43 @@ FEATURES:
 """
 
 import os
+import re
+import sys
 import platform
 import requests
 import zipfile
 import subprocess
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, Menu
+import tkinter.font as tkfont
 import shutil
+import struct
+import bisect
+import tempfile
 from pathlib import Path
 import time
 import json
+import mmap
+import plistlib
+import functools
+from types import MappingProxyType
+from typing import NamedTuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional; both parsers accept the raw bytes system_profiler emits
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# PyObjC (macOS) lets us activate RetroArch without forking osascript
+try:
+    from AppKit import NSRunningApplication, NSApplicationActivateIgnoringOtherApps
+except ImportError:
+    NSRunningApplication = None
 
 # =============================================================================
 # SYSTEM DETECTION
@@ -59,430 +86,566 @@ print(f"[Setup] Apple Silicon: {IS_APPLE_SILICON}")
 # CONTROLLER DATABASE — ALL CONTROLLERS SINCE 1985
 # =============================================================================
 
-CONTROLLER_DATABASE = {
-    # === 1985-1989: 8-bit Era ===
-    "nes": {
-        "name": "NES Controller",
-        "year": 1985,
-        "vendor_ids": ["0x0079"],  # iBuffalo, RetroUSB
-        "buttons": ["A", "B", "Select", "Start", "D-Pad"],
-        "n64_map": {"A": "a", "B": "b", "Start": "start"}
-    },
-    "atari_7800": {
-        "name": "Atari 7800 ProLine",
-        "year": 1986,
-        "vendor_ids": ["0x0001"],
-        "buttons": ["Fire1", "Fire2", "D-Pad"],
-        "n64_map": {"Fire1": "a", "Fire2": "b"}
-    },
-    "master_system": {
-        "name": "Sega Master System",
-        "year": 1986,
-        "vendor_ids": [],
-        "buttons": ["1", "2", "D-Pad"],
-        "n64_map": {"1": "a", "2": "b"}
-    },
-    
-    # === 1990-1994: 16-bit Era ===
-    "snes": {
-        "name": "SNES Controller",
-        "year": 1990,
-        "vendor_ids": ["0x0079", "0x081F"],  # Various USB adapters
-        "buttons": ["A", "B", "X", "Y", "L", "R", "Select", "Start", "D-Pad"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "Start": "start"}
-    },
-    "genesis_3btn": {
-        "name": "Sega Genesis 3-Button",
-        "year": 1989,
-        "vendor_ids": ["0x0079"],
-        "buttons": ["A", "B", "C", "Start", "D-Pad"],
-        "n64_map": {"A": "a", "B": "b", "C": "c_down", "Start": "start"}
-    },
-    "genesis_6btn": {
-        "name": "Sega Genesis 6-Button",
-        "year": 1993,
-        "vendor_ids": ["0x0079", "0x1BAD"],
-        "buttons": ["A", "B", "C", "X", "Y", "Z", "Start", "Mode", "D-Pad"],
-        "n64_map": {"A": "a", "B": "b", "C": "c_down", "X": "c_up", "Y": "c_left", "Z": "c_right", "Start": "start"}
-    },
-    "turbografx": {
-        "name": "TurboGrafx-16",
-        "year": 1989,
-        "vendor_ids": [],
-        "buttons": ["I", "II", "Select", "Run", "D-Pad"],
-        "n64_map": {"I": "a", "II": "b", "Run": "start"}
-    },
-    "neo_geo": {
-        "name": "Neo Geo AES",
-        "year": 1990,
-        "vendor_ids": [],
-        "buttons": ["A", "B", "C", "D", "Start", "Select", "Stick"],
-        "n64_map": {"A": "a", "B": "b", "C": "c_down", "D": "c_right", "Start": "start"}
-    },
-    
-    # === 1995-1999: 32/64-bit Era ===
-    "ps1": {
-        "name": "PlayStation DualShock",
-        "year": 1997,
-        "vendor_ids": ["0x054C"],  # Sony
-        "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Select", "Start", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Start": "start", "Left Stick": "analog"}
-    },
-    "saturn": {
-        "name": "Sega Saturn",
-        "year": 1995,
-        "vendor_ids": ["0x0CA3"],  # Retro-Bit
-        "buttons": ["A", "B", "C", "X", "Y", "Z", "L", "R", "Start", "D-Pad"],
-        "n64_map": {"A": "a", "B": "b", "C": "c_down", "X": "c_up", "Y": "c_left", "Z": "c_right", "L": "l", "R": "r", "Start": "start"}
-    },
-    "n64": {
-        "name": "Nintendo 64",
-        "year": 1996,
-        "vendor_ids": ["0x0079", "0x057E"],  # USB adapters, Nintendo
-        "buttons": ["A", "B", "Z", "L", "R", "Start", "C-Up", "C-Down", "C-Left", "C-Right", "D-Pad", "Analog Stick"],
-        "n64_map": "native"
-    },
-    "dreamcast": {
-        "name": "Sega Dreamcast",
-        "year": 1999,
-        "vendor_ids": ["0x0CA3"],  # Retro-Bit
-        "buttons": ["A", "B", "X", "Y", "L", "R", "Start", "D-Pad", "Analog Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "Start": "start", "Analog Stick": "analog"}
-    },
-    
-    # === 2000-2004: 128-bit Era ===
-    "ps2": {
-        "name": "PlayStation 2 DualShock 2",
-        "year": 2000,
-        "vendor_ids": ["0x054C"],
-        "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Select", "Start", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Start": "start", "Left Stick": "analog"}
-    },
-    "xbox_duke": {
-        "name": "Xbox Duke",
-        "year": 2001,
-        "vendor_ids": ["0x045E"],  # Microsoft
-        "buttons": ["A", "B", "X", "Y", "Black", "White", "L", "R", "Start", "Back", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "Black": "c_right", "White": "c_down", "L": "l", "R": "r", "Start": "start", "Left Stick": "analog"}
-    },
-    "xbox_s": {
-        "name": "Xbox Controller S",
-        "year": 2002,
-        "vendor_ids": ["0x045E"],
-        "buttons": ["A", "B", "X", "Y", "Black", "White", "L", "R", "Start", "Back", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "Start": "start", "Left Stick": "analog"}
-    },
-    "gamecube": {
-        "name": "Nintendo GameCube",
-        "year": 2001,
-        "vendor_ids": ["0x057E", "0x0079"],
-        "buttons": ["A", "B", "X", "Y", "Z", "L", "R", "Start", "D-Pad", "Control Stick", "C-Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "Z": "z", "L": "l", "R": "r", "Start": "start", "Control Stick": "analog", "C-Stick": "c_buttons"}
-    },
-    
-    # === 2005-2009: HD Era ===
-    "xbox_360": {
-        "name": "Xbox 360",
-        "year": 2005,
-        "vendor_ids": ["0x045E", "0x24C6", "0x0738"],  # Microsoft, Razer, MadCatz
-        "product_patterns": ["Xbox 360", "X360"],
-        "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "Back", "Start", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Start": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
-    },
-    "ps3": {
-        "name": "PlayStation 3 DualShock 3/Sixaxis",
-        "year": 2006,
-        "vendor_ids": ["0x054C"],
-        "product_patterns": ["PLAYSTATION(R)3", "DUALSHOCK 3", "SIXAXIS"],
-        "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Select", "Start", "PS", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Start": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
-    },
-    "wii_remote": {
-        "name": "Wii Remote",
-        "year": 2006,
-        "vendor_ids": ["0x057E"],
-        "product_patterns": ["Wii Remote", "RVL-CNT"],
-        "buttons": ["A", "B", "1", "2", "+", "-", "Home", "D-Pad"],
-        "n64_map": {"A": "a", "B": "b", "1": "c_down", "2": "c_up", "+": "start"}
-    },
-    "wii_classic": {
-        "name": "Wii Classic Controller",
-        "year": 2006,
-        "vendor_ids": ["0x057E"],
-        "buttons": ["a", "b", "x", "y", "L", "R", "ZL", "ZR", "+", "-", "Home", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"a": "a", "b": "b", "x": "c_up", "y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog"}
-    },
-    
-    # === 2010-2014: Motion Era ===
-    "wii_u_pro": {
-        "name": "Wii U Pro Controller",
-        "year": 2012,
-        "vendor_ids": ["0x057E"],
-        "product_patterns": ["Wii U Pro"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "+", "-", "Home", "D-Pad", "Left Stick", "Right Stick", "LS", "RS"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
-    },
-    "wii_u_gamepad": {
-        "name": "Wii U GamePad",
-        "year": 2012,
-        "vendor_ids": ["0x057E"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "+", "-", "Home", "D-Pad", "Left Stick", "Right Stick", "Touch Screen"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog"}
-    },
-    
-    # === 2015-2019: Current Gen ===
-    "ps4": {
-        "name": "PlayStation 4 DualShock 4",
-        "year": 2013,
-        "vendor_ids": ["0x054C"],
-        "product_patterns": ["DualShock 4", "Wireless Controller"],
-        "product_ids": ["0x05C4", "0x09CC", "0x0BA0"],
-        "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Share", "Options", "PS", "Touchpad", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Options": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
-    },
-    "xbox_one": {
-        "name": "Xbox One",
-        "year": 2013,
-        "vendor_ids": ["0x045E", "0x0E6F", "0x24C6"],  # Microsoft, PDP, Razer
-        "product_patterns": ["Xbox One", "Xbox Wireless"],
-        "product_ids": ["0x02D1", "0x02DD", "0x02E3", "0x02EA", "0x0B00", "0x0B0A", "0x0B12"],
-        "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "View", "Menu", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
-    },
-    "steam_controller": {
-        "name": "Steam Controller",
-        "year": 2015,
-        "vendor_ids": ["0x28DE"],  # Valve
-        "product_patterns": ["Steam Controller", "Valve Software Steam Controller"],
-        "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "Back", "Start", "Steam", "Left Trackpad", "Right Trackpad", "Joystick", "Gyro"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Start": "start", "Joystick": "analog", "Right Trackpad": "c_buttons"}
-    },
-    
-    # === 2017-2019: Switch Era ===
-    "switch_pro": {
-        "name": "Nintendo Switch Pro Controller",
-        "year": 2017,
-        "vendor_ids": ["0x057E"],
-        "product_ids": ["0x2009"],
-        "product_patterns": ["Pro Controller", "Switch Pro"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "-", "+", "Home", "Capture", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "joycon_l": {
-        "name": "Nintendo Switch Joy-Con (L)",
-        "year": 2017,
-        "vendor_ids": ["0x057E"],
-        "product_ids": ["0x2006"],
-        "product_patterns": ["Joy-Con (L)", "Joy-Con Left"],
-        "buttons": ["L", "ZL", "-", "Capture", "SL", "SR", "Stick", "D-Pad"],
-        "n64_map": {"L": "l", "ZL": "z", "-": "start", "Stick": "analog"},
-        "auto_detect": True
-    },
-    "joycon_r": {
-        "name": "Nintendo Switch Joy-Con (R)",
-        "year": 2017,
-        "vendor_ids": ["0x057E"],
-        "product_ids": ["0x2007"],
-        "product_patterns": ["Joy-Con (R)", "Joy-Con Right"],
-        "buttons": ["A", "B", "X", "Y", "R", "ZR", "+", "Home", "SL", "SR", "Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "R": "r", "ZR": "z", "+": "start", "Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "joycon_pair": {
-        "name": "Nintendo Switch Joy-Con Pair",
-        "year": 2017,
-        "vendor_ids": ["0x057E"],
-        "product_patterns": ["Joy-Con", "Combined Joy-Con"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "-", "+", "Home", "Capture", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "switch_snes": {
-        "name": "Nintendo Switch SNES Controller",
-        "year": 2019,
-        "vendor_ids": ["0x057E"],
-        "product_ids": ["0x2017"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "-", "+", "D-Pad"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "+": "start"}
-    },
-    "switch_n64": {
-        "name": "Nintendo Switch N64 Controller",
-        "year": 2021,
-        "vendor_ids": ["0x057E"],
-        "product_ids": ["0x2019"],
-        "buttons": ["A", "B", "Z", "L", "R", "Start", "C-Up", "C-Down", "C-Left", "C-Right", "D-Pad", "Analog Stick"],
-        "n64_map": "native",
-        "auto_detect": True
-    },
-    
-    # === 2020-2024: Next Gen ===
-    "ps5": {
-        "name": "PlayStation 5 DualSense",
-        "year": 2020,
-        "vendor_ids": ["0x054C"],
-        "product_ids": ["0x0CE6", "0x0DF2"],
-        "product_patterns": ["DualSense", "PS5 Controller"],
-        "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Create", "Options", "PS", "Mute", "Touchpad", "D-Pad", "Left Stick", "Right Stick"],
-        "features": ["Haptic Feedback", "Adaptive Triggers"],
-        "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Options": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "ps5_edge": {
-        "name": "PlayStation 5 DualSense Edge",
-        "year": 2023,
-        "vendor_ids": ["0x054C"],
-        "product_ids": ["0x0D5E"],
-        "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Create", "Options", "PS", "Mute", "Fn1", "Fn2", "Back Buttons", "Touchpad", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Options": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "xbox_series": {
-        "name": "Xbox Series X|S",
-        "year": 2020,
-        "vendor_ids": ["0x045E"],
-        "product_ids": ["0x0B13", "0x0B20", "0x0B21", "0x0B22"],
-        "product_patterns": ["Xbox Series", "Xbox Wireless Controller"],
-        "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "View", "Menu", "Share", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "xbox_elite_2": {
-        "name": "Xbox Elite Series 2",
-        "year": 2019,
-        "vendor_ids": ["0x045E"],
-        "product_ids": ["0x0B00", "0x0B05"],
-        "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "View", "Menu", "LS", "RS", "D-Pad", "Left Stick", "Right Stick", "P1", "P2", "P3", "P4"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    
-    # === Third Party / Modern ===
-    "8bitdo_pro2": {
-        "name": "8BitDo Pro 2",
-        "year": 2021,
-        "vendor_ids": ["0x2DC8", "0x045E"],  # 8BitDo, xinput mode
-        "product_patterns": ["8BitDo Pro 2", "Pro 2"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "L2", "R2", "-", "+", "Home", "Star", "L3", "R3", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "L2": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "8bitdo_sn30": {
-        "name": "8BitDo SN30 Pro",
-        "year": 2018,
-        "vendor_ids": ["0x2DC8"],
-        "product_patterns": ["8BitDo SN30", "SN30 Pro"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "L2", "R2", "-", "+", "Home", "Star", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "L2": "z", "+": "start", "Left Stick": "analog"}
-    },
-    "8bitdo_ultimate": {
-        "name": "8BitDo Ultimate Controller",
-        "year": 2022,
-        "vendor_ids": ["0x2DC8"],
-        "product_patterns": ["8BitDo Ultimate", "Ultimate Controller"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "L2", "R2", "-", "+", "Home", "L3", "R3", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "L2": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "backbone_one": {
-        "name": "Backbone One",
-        "year": 2020,
-        "vendor_ids": ["0x358A"],
-        "product_patterns": ["Backbone One", "Backbone"],
-        "buttons": ["A", "B", "X", "Y", "L1", "R1", "L2", "R2", "L3", "R3", "Options", "Menu", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L1": "l", "R1": "r", "L2": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "razer_kishi": {
-        "name": "Razer Kishi",
-        "year": 2020,
-        "vendor_ids": ["0x1532"],  # Razer
-        "product_patterns": ["Razer Kishi", "Kishi"],
-        "buttons": ["A", "B", "X", "Y", "L1", "R1", "L2", "R2", "L3", "R3", "Menu", "Options", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L1": "l", "R1": "r", "L2": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "gulikit_kingkong": {
-        "name": "GuliKit KingKong Pro",
-        "year": 2021,
-        "vendor_ids": ["0x0E8F"],
-        "product_patterns": ["GuliKit", "KingKong"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "-", "+", "Home", "Capture", "L3", "R3", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    "hori_split_pad": {
-        "name": "HORI Split Pad Pro",
-        "year": 2019,
-        "vendor_ids": ["0x0F0D"],  # HORI
-        "product_patterns": ["Split Pad", "HORI"],
-        "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "-", "+", "Home", "Capture", "L3", "R3", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
-        "auto_detect": True
-    },
-    
-    # === Arcade / Fight Sticks ===
-    "arcade_stick": {
-        "name": "Generic Arcade Stick",
-        "year": 1980,
-        "vendor_ids": [],
-        "product_patterns": ["Arcade", "Fight Stick", "Fightstick"],
-        "buttons": ["1", "2", "3", "4", "5", "6", "7", "8", "Start", "Select", "Joystick"],
-        "n64_map": {"1": "a", "2": "b", "3": "c_down", "4": "c_up", "5": "l", "6": "r", "Start": "start", "Joystick": "analog"}
-    },
-    "hori_rap": {
-        "name": "HORI Real Arcade Pro",
-        "year": 2005,
-        "vendor_ids": ["0x0F0D"],
-        "product_patterns": ["Real Arcade Pro", "RAP", "HORI Arcade"],
-        "buttons": ["Square", "Triangle", "R1", "L1", "X", "O", "R2", "L2", "Share", "Options", "L3", "R3", "PS", "Touchpad", "Joystick"],
-        "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Options": "start", "Joystick": "analog"}
-    },
-    
-    # === Retro USB Adapters ===
-    "raphnet_n64": {
-        "name": "Raphnet N64 to USB",
-        "year": 2010,
-        "vendor_ids": ["0x289B"],
-        "product_patterns": ["raphnet", "N64 to USB"],
-        "buttons": ["A", "B", "Z", "L", "R", "Start", "C-Up", "C-Down", "C-Left", "C-Right", "D-Pad", "Analog Stick"],
-        "n64_map": "native"
-    },
-    "mayflash_n64": {
-        "name": "Mayflash N64 Adapter",
-        "year": 2012,
-        "vendor_ids": ["0x0079", "0x0E8F"],
-        "product_patterns": ["Mayflash", "N64"],
-        "buttons": ["A", "B", "Z", "L", "R", "Start", "C-Up", "C-Down", "C-Left", "C-Right", "D-Pad", "Analog Stick"],
-        "n64_map": "native"
-    },
-    "retro_usb": {
-        "name": "RetroUSB AVS/Retro Controller",
-        "year": 2010,
-        "vendor_ids": ["0x1781"],
-        "product_patterns": ["RetroUSB", "AVS"],
-        "buttons": ["A", "B", "Select", "Start", "D-Pad"],
-        "n64_map": {"A": "a", "B": "b", "Start": "start"}
-    },
-    
-    # === Generic / Unknown ===
-    "generic_xinput": {
-        "name": "Generic XInput Controller",
-        "year": 2005,
-        "vendor_ids": [],
-        "product_patterns": ["XInput", "Controller", "Gamepad", "Game Controller"],
-        "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "Back", "Start", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
-        "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Start": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
-    },
-    "generic_dinput": {
-        "name": "Generic DirectInput Controller",
-        "year": 1995,
-        "vendor_ids": [],
-        "product_patterns": ["DirectInput", "USB Gamepad", "USB Joystick"],
-        "buttons": ["Button 1", "Button 2", "Button 3", "Button 4", "L1", "R1", "L2", "R2", "Select", "Start", "D-Pad", "Axes"],
-        "n64_map": {"Button 1": "a", "Button 2": "b", "Button 3": "c_down", "Button 4": "c_up", "L1": "l", "R1": "r", "Start": "start"}
+@functools.cache
+def _controller_db():
+    """Controller database, built on first use rather than at import"""
+    db = {
+        # === 1985-1989: 8-bit Era ===
+        "nes": {
+            "name": "NES Controller",
+            "year": 1985,
+            "vendor_ids": ["0x0079"],  # iBuffalo, RetroUSB
+            "buttons": ["A", "B", "Select", "Start", "D-Pad"],
+            "n64_map": {"A": "a", "B": "b", "Start": "start"}
+        },
+        "atari_7800": {
+            "name": "Atari 7800 ProLine",
+            "year": 1986,
+            "vendor_ids": ["0x0001"],
+            "buttons": ["Fire1", "Fire2", "D-Pad"],
+            "n64_map": {"Fire1": "a", "Fire2": "b"}
+        },
+        "master_system": {
+            "name": "Sega Master System",
+            "year": 1986,
+            "vendor_ids": [],
+            "buttons": ["1", "2", "D-Pad"],
+            "n64_map": {"1": "a", "2": "b"}
+        },
+        
+        # === 1990-1994: 16-bit Era ===
+        "snes": {
+            "name": "SNES Controller",
+            "year": 1990,
+            "vendor_ids": ["0x0079", "0x081F"],  # Various USB adapters
+            "buttons": ["A", "B", "X", "Y", "L", "R", "Select", "Start", "D-Pad"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "Start": "start"}
+        },
+        "genesis_3btn": {
+            "name": "Sega Genesis 3-Button",
+            "year": 1989,
+            "vendor_ids": ["0x0079"],
+            "buttons": ["A", "B", "C", "Start", "D-Pad"],
+            "n64_map": {"A": "a", "B": "b", "C": "c_down", "Start": "start"}
+        },
+        "genesis_6btn": {
+            "name": "Sega Genesis 6-Button",
+            "year": 1993,
+            "vendor_ids": ["0x0079", "0x1BAD"],
+            "buttons": ["A", "B", "C", "X", "Y", "Z", "Start", "Mode", "D-Pad"],
+            "n64_map": {"A": "a", "B": "b", "C": "c_down", "X": "c_up", "Y": "c_left", "Z": "c_right", "Start": "start"}
+        },
+        "turbografx": {
+            "name": "TurboGrafx-16",
+            "year": 1989,
+            "vendor_ids": [],
+            "buttons": ["I", "II", "Select", "Run", "D-Pad"],
+            "n64_map": {"I": "a", "II": "b", "Run": "start"}
+        },
+        "neo_geo": {
+            "name": "Neo Geo AES",
+            "year": 1990,
+            "vendor_ids": [],
+            "buttons": ["A", "B", "C", "D", "Start", "Select", "Stick"],
+            "n64_map": {"A": "a", "B": "b", "C": "c_down", "D": "c_right", "Start": "start"}
+        },
+        
+        # === 1995-1999: 32/64-bit Era ===
+        "ps1": {
+            "name": "PlayStation DualShock",
+            "year": 1997,
+            "vendor_ids": ["0x054C"],  # Sony
+            "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Select", "Start", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Start": "start", "Left Stick": "analog"}
+        },
+        "saturn": {
+            "name": "Sega Saturn",
+            "year": 1995,
+            "vendor_ids": ["0x0CA3"],  # Retro-Bit
+            "buttons": ["A", "B", "C", "X", "Y", "Z", "L", "R", "Start", "D-Pad"],
+            "n64_map": {"A": "a", "B": "b", "C": "c_down", "X": "c_up", "Y": "c_left", "Z": "c_right", "L": "l", "R": "r", "Start": "start"}
+        },
+        "n64": {
+            "name": "Nintendo 64",
+            "year": 1996,
+            "vendor_ids": ["0x0079", "0x057E"],  # USB adapters, Nintendo
+            "buttons": ["A", "B", "Z", "L", "R", "Start", "C-Up", "C-Down", "C-Left", "C-Right", "D-Pad", "Analog Stick"],
+            "n64_map": "native"
+        },
+        "dreamcast": {
+            "name": "Sega Dreamcast",
+            "year": 1999,
+            "vendor_ids": ["0x0CA3"],  # Retro-Bit
+            "buttons": ["A", "B", "X", "Y", "L", "R", "Start", "D-Pad", "Analog Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "Start": "start", "Analog Stick": "analog"}
+        },
+        
+        # === 2000-2004: 128-bit Era ===
+        "ps2": {
+            "name": "PlayStation 2 DualShock 2",
+            "year": 2000,
+            "vendor_ids": ["0x054C"],
+            "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Select", "Start", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Start": "start", "Left Stick": "analog"}
+        },
+        "xbox_duke": {
+            "name": "Xbox Duke",
+            "year": 2001,
+            "vendor_ids": ["0x045E"],  # Microsoft
+            "buttons": ["A", "B", "X", "Y", "Black", "White", "L", "R", "Start", "Back", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "Black": "c_right", "White": "c_down", "L": "l", "R": "r", "Start": "start", "Left Stick": "analog"}
+        },
+        "xbox_s": {
+            "name": "Xbox Controller S",
+            "year": 2002,
+            "vendor_ids": ["0x045E"],
+            "buttons": ["A", "B", "X", "Y", "Black", "White", "L", "R", "Start", "Back", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "Start": "start", "Left Stick": "analog"}
+        },
+        "gamecube": {
+            "name": "Nintendo GameCube",
+            "year": 2001,
+            "vendor_ids": ["0x057E", "0x0079"],
+            "buttons": ["A", "B", "X", "Y", "Z", "L", "R", "Start", "D-Pad", "Control Stick", "C-Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "Z": "z", "L": "l", "R": "r", "Start": "start", "Control Stick": "analog", "C-Stick": "c_buttons"}
+        },
+        
+        # === 2005-2009: HD Era ===
+        "xbox_360": {
+            "name": "Xbox 360",
+            "year": 2005,
+            "vendor_ids": ["0x045E", "0x24C6", "0x0738"],  # Microsoft, Razer, MadCatz
+            "product_patterns": ["Xbox 360", "X360"],
+            "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "Back", "Start", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Start": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
+        },
+        "ps3": {
+            "name": "PlayStation 3 DualShock 3/Sixaxis",
+            "year": 2006,
+            "vendor_ids": ["0x054C"],
+            "product_patterns": ["PLAYSTATION(R)3", "DUALSHOCK 3", "SIXAXIS"],
+            "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Select", "Start", "PS", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Start": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
+        },
+        "wii_remote": {
+            "name": "Wii Remote",
+            "year": 2006,
+            "vendor_ids": ["0x057E"],
+            "product_patterns": ["Wii Remote", "RVL-CNT"],
+            "buttons": ["A", "B", "1", "2", "+", "-", "Home", "D-Pad"],
+            "n64_map": {"A": "a", "B": "b", "1": "c_down", "2": "c_up", "+": "start"}
+        },
+        "wii_classic": {
+            "name": "Wii Classic Controller",
+            "year": 2006,
+            "vendor_ids": ["0x057E"],
+            "buttons": ["a", "b", "x", "y", "L", "R", "ZL", "ZR", "+", "-", "Home", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"a": "a", "b": "b", "x": "c_up", "y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog"}
+        },
+        
+        # === 2010-2014: Motion Era ===
+        "wii_u_pro": {
+            "name": "Wii U Pro Controller",
+            "year": 2012,
+            "vendor_ids": ["0x057E"],
+            "product_patterns": ["Wii U Pro"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "+", "-", "Home", "D-Pad", "Left Stick", "Right Stick", "LS", "RS"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
+        },
+        "wii_u_gamepad": {
+            "name": "Wii U GamePad",
+            "year": 2012,
+            "vendor_ids": ["0x057E"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "+", "-", "Home", "D-Pad", "Left Stick", "Right Stick", "Touch Screen"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog"}
+        },
+        
+        # === 2015-2019: Current Gen ===
+        "ps4": {
+            "name": "PlayStation 4 DualShock 4",
+            "year": 2013,
+            "vendor_ids": ["0x054C"],
+            "product_patterns": ["DualShock 4", "Wireless Controller"],
+            "product_ids": ["0x05C4", "0x09CC", "0x0BA0"],
+            "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Share", "Options", "PS", "Touchpad", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Options": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
+        },
+        "xbox_one": {
+            "name": "Xbox One",
+            "year": 2013,
+            "vendor_ids": ["0x045E", "0x0E6F", "0x24C6"],  # Microsoft, PDP, Razer
+            "product_patterns": ["Xbox One", "Xbox Wireless"],
+            "product_ids": ["0x02D1", "0x02DD", "0x02E3", "0x02EA", "0x0B00", "0x0B0A", "0x0B12"],
+            "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "View", "Menu", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
+        },
+        "steam_controller": {
+            "name": "Steam Controller",
+            "year": 2015,
+            "vendor_ids": ["0x28DE"],  # Valve
+            "product_patterns": ["Steam Controller", "Valve Software Steam Controller"],
+            "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "Back", "Start", "Steam", "Left Trackpad", "Right Trackpad", "Joystick", "Gyro"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Start": "start", "Joystick": "analog", "Right Trackpad": "c_buttons"}
+        },
+        
+        # === 2017-2019: Switch Era ===
+        "switch_pro": {
+            "name": "Nintendo Switch Pro Controller",
+            "year": 2017,
+            "vendor_ids": ["0x057E"],
+            "product_ids": ["0x2009"],
+            "product_patterns": ["Pro Controller", "Switch Pro"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "-", "+", "Home", "Capture", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "joycon_l": {
+            "name": "Nintendo Switch Joy-Con (L)",
+            "year": 2017,
+            "vendor_ids": ["0x057E"],
+            "product_ids": ["0x2006"],
+            "product_patterns": ["Joy-Con (L)", "Joy-Con Left"],
+            "buttons": ["L", "ZL", "-", "Capture", "SL", "SR", "Stick", "D-Pad"],
+            "n64_map": {"L": "l", "ZL": "z", "-": "start", "Stick": "analog"},
+            "auto_detect": True
+        },
+        "joycon_r": {
+            "name": "Nintendo Switch Joy-Con (R)",
+            "year": 2017,
+            "vendor_ids": ["0x057E"],
+            "product_ids": ["0x2007"],
+            "product_patterns": ["Joy-Con (R)", "Joy-Con Right"],
+            "buttons": ["A", "B", "X", "Y", "R", "ZR", "+", "Home", "SL", "SR", "Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "R": "r", "ZR": "z", "+": "start", "Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "joycon_pair": {
+            "name": "Nintendo Switch Joy-Con Pair",
+            "year": 2017,
+            "vendor_ids": ["0x057E"],
+            "product_patterns": ["Joy-Con", "Combined Joy-Con"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "-", "+", "Home", "Capture", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "switch_snes": {
+            "name": "Nintendo Switch SNES Controller",
+            "year": 2019,
+            "vendor_ids": ["0x057E"],
+            "product_ids": ["0x2017"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "-", "+", "D-Pad"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "+": "start"}
+        },
+        "switch_n64": {
+            "name": "Nintendo Switch N64 Controller",
+            "year": 2021,
+            "vendor_ids": ["0x057E"],
+            "product_ids": ["0x2019"],
+            "buttons": ["A", "B", "Z", "L", "R", "Start", "C-Up", "C-Down", "C-Left", "C-Right", "D-Pad", "Analog Stick"],
+            "n64_map": "native",
+            "auto_detect": True
+        },
+        
+        # === 2020-2024: Next Gen ===
+        "ps5": {
+            "name": "PlayStation 5 DualSense",
+            "year": 2020,
+            "vendor_ids": ["0x054C"],
+            "product_ids": ["0x0CE6", "0x0DF2"],
+            "product_patterns": ["DualSense", "PS5 Controller"],
+            "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Create", "Options", "PS", "Mute", "Touchpad", "D-Pad", "Left Stick", "Right Stick"],
+            "features": ["Haptic Feedback", "Adaptive Triggers"],
+            "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Options": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "ps5_edge": {
+            "name": "PlayStation 5 DualSense Edge",
+            "year": 2023,
+            "vendor_ids": ["0x054C"],
+            "product_ids": ["0x0D5E"],
+            "buttons": ["X", "O", "Square", "Triangle", "L1", "R1", "L2", "R2", "L3", "R3", "Create", "Options", "PS", "Mute", "Fn1", "Fn2", "Back Buttons", "Touchpad", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Options": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "xbox_series": {
+            "name": "Xbox Series X|S",
+            "year": 2020,
+            "vendor_ids": ["0x045E"],
+            "product_ids": ["0x0B13", "0x0B20", "0x0B21", "0x0B22"],
+            "product_patterns": ["Xbox Series", "Xbox Wireless Controller"],
+            "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "View", "Menu", "Share", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "xbox_elite_2": {
+            "name": "Xbox Elite Series 2",
+            "year": 2019,
+            "vendor_ids": ["0x045E"],
+            "product_ids": ["0x0B00", "0x0B05"],
+            "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "View", "Menu", "LS", "RS", "D-Pad", "Left Stick", "Right Stick", "P1", "P2", "P3", "P4"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        
+        # === Third Party / Modern ===
+        "8bitdo_pro2": {
+            "name": "8BitDo Pro 2",
+            "year": 2021,
+            "vendor_ids": ["0x2DC8", "0x045E"],  # 8BitDo, xinput mode
+            "product_patterns": ["8BitDo Pro 2", "Pro 2"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "L2", "R2", "-", "+", "Home", "Star", "L3", "R3", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "L2": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "8bitdo_sn30": {
+            "name": "8BitDo SN30 Pro",
+            "year": 2018,
+            "vendor_ids": ["0x2DC8"],
+            "product_patterns": ["8BitDo SN30", "SN30 Pro"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "L2", "R2", "-", "+", "Home", "Star", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "L2": "z", "+": "start", "Left Stick": "analog"}
+        },
+        "8bitdo_ultimate": {
+            "name": "8BitDo Ultimate Controller",
+            "year": 2022,
+            "vendor_ids": ["0x2DC8"],
+            "product_patterns": ["8BitDo Ultimate", "Ultimate Controller"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "L2", "R2", "-", "+", "Home", "L3", "R3", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "L2": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "backbone_one": {
+            "name": "Backbone One",
+            "year": 2020,
+            "vendor_ids": ["0x358A"],
+            "product_patterns": ["Backbone One", "Backbone"],
+            "buttons": ["A", "B", "X", "Y", "L1", "R1", "L2", "R2", "L3", "R3", "Options", "Menu", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L1": "l", "R1": "r", "L2": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "razer_kishi": {
+            "name": "Razer Kishi",
+            "year": 2020,
+            "vendor_ids": ["0x1532"],  # Razer
+            "product_patterns": ["Razer Kishi", "Kishi"],
+            "buttons": ["A", "B", "X", "Y", "L1", "R1", "L2", "R2", "L3", "R3", "Menu", "Options", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L1": "l", "R1": "r", "L2": "z", "Menu": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "gulikit_kingkong": {
+            "name": "GuliKit KingKong Pro",
+            "year": 2021,
+            "vendor_ids": ["0x0E8F"],
+            "product_patterns": ["GuliKit", "KingKong"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "-", "+", "Home", "Capture", "L3", "R3", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        "hori_split_pad": {
+            "name": "HORI Split Pad Pro",
+            "year": 2019,
+            "vendor_ids": ["0x0F0D"],  # HORI
+            "product_patterns": ["Split Pad", "HORI"],
+            "buttons": ["A", "B", "X", "Y", "L", "R", "ZL", "ZR", "-", "+", "Home", "Capture", "L3", "R3", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "L": "l", "R": "r", "ZL": "z", "+": "start", "Left Stick": "analog", "Right Stick": "c_buttons"},
+            "auto_detect": True
+        },
+        
+        # === Arcade / Fight Sticks ===
+        "arcade_stick": {
+            "name": "Generic Arcade Stick",
+            "year": 1980,
+            "vendor_ids": [],
+            "product_patterns": ["Arcade", "Fight Stick", "Fightstick"],
+            "buttons": ["1", "2", "3", "4", "5", "6", "7", "8", "Start", "Select", "Joystick"],
+            "n64_map": {"1": "a", "2": "b", "3": "c_down", "4": "c_up", "5": "l", "6": "r", "Start": "start", "Joystick": "analog"}
+        },
+        "hori_rap": {
+            "name": "HORI Real Arcade Pro",
+            "year": 2005,
+            "vendor_ids": ["0x0F0D"],
+            "product_patterns": ["Real Arcade Pro", "RAP", "HORI Arcade"],
+            "buttons": ["Square", "Triangle", "R1", "L1", "X", "O", "R2", "L2", "Share", "Options", "L3", "R3", "PS", "Touchpad", "Joystick"],
+            "n64_map": {"X": "a", "O": "b", "Square": "c_left", "Triangle": "c_up", "L1": "l", "R1": "r", "L2": "z", "Options": "start", "Joystick": "analog"}
+        },
+        
+        # === Retro USB Adapters ===
+        "raphnet_n64": {
+            "name": "Raphnet N64 to USB",
+            "year": 2010,
+            "vendor_ids": ["0x289B"],
+            "product_patterns": ["raphnet", "N64 to USB"],
+            "buttons": ["A", "B", "Z", "L", "R", "Start", "C-Up", "C-Down", "C-Left", "C-Right", "D-Pad", "Analog Stick"],
+            "n64_map": "native"
+        },
+        "mayflash_n64": {
+            "name": "Mayflash N64 Adapter",
+            "year": 2012,
+            "vendor_ids": ["0x0079", "0x0E8F"],
+            "product_patterns": ["Mayflash", "N64"],
+            "buttons": ["A", "B", "Z", "L", "R", "Start", "C-Up", "C-Down", "C-Left", "C-Right", "D-Pad", "Analog Stick"],
+            "n64_map": "native"
+        },
+        "retro_usb": {
+            "name": "RetroUSB AVS/Retro Controller",
+            "year": 2010,
+            "vendor_ids": ["0x1781"],
+            "product_patterns": ["RetroUSB", "AVS"],
+            "buttons": ["A", "B", "Select", "Start", "D-Pad"],
+            "n64_map": {"A": "a", "B": "b", "Start": "start"}
+        },
+        
+        # === Generic / Unknown ===
+        "generic_xinput": {
+            "name": "Generic XInput Controller",
+            "year": 2005,
+            "vendor_ids": [],
+            "product_patterns": ["XInput", "Controller", "Gamepad", "Game Controller"],
+            "buttons": ["A", "B", "X", "Y", "LB", "RB", "LT", "RT", "Back", "Start", "LS", "RS", "D-Pad", "Left Stick", "Right Stick"],
+            "n64_map": {"A": "a", "B": "b", "X": "c_up", "Y": "c_left", "LB": "l", "RB": "r", "LT": "z", "Start": "start", "Left Stick": "analog", "Right Stick": "c_buttons"}
+        },
+        "generic_dinput": {
+            "name": "Generic DirectInput Controller",
+            "year": 1995,
+            "vendor_ids": [],
+            "product_patterns": ["DirectInput", "USB Gamepad", "USB Joystick"],
+            "buttons": ["Button 1", "Button 2", "Button 3", "Button 4", "L1", "R1", "L2", "R2", "Select", "Start", "D-Pad", "Axes"],
+            "n64_map": {"Button 1": "a", "Button 2": "b", "Button 3": "c_down", "Button 4": "c_up", "L1": "l", "R1": "r", "Start": "start"}
+        }
+    }
+    
+    # Intern the database strings so lookups keyed on them hit the fast path.
+    # (Identifier-like literals such as "n64_map" are interned by the compiler.)
+    # The list fields are never mutated, so they're stored as tuples.
+    for data in db.values():
+        data["name"] = sys.intern(data["name"])
+        for field in ("vendor_ids", "product_ids", "product_patterns", "buttons", "features"):
+            if field in data:
+                data[field] = tuple(sys.intern(s) for s in data[field])
+        if isinstance(data.get("n64_map"), dict):
+            data["n64_map"] = {sys.intern(k): sys.intern(v) for k, v in data["n64_map"].items()}
+        data["ctype"] = _classify(data["name"])
+    
+    return db
+
+# First keyword found in a controller name decides its vendor type
+_VENDOR_KEYS = (
+    ("Switch", "Nintendo"), ("Joy-Con", "Nintendo"),
+    ("PlayStation", "Sony"), ("DualShock", "Sony"), ("DualSense", "Sony"),
+    ("Xbox", "Microsoft"),
+    ("8BitDo", "Third Party"), ("Backbone", "Third Party"), ("Razer", "Third Party"),
+    ("Sega", "Sega"), ("Genesis", "Sega"), ("Saturn", "Sega"),
+)
+
+def _classify(name):
+    return next((ctype for keyword, ctype in _VENDOR_KEYS if keyword in name), "Other")
+
+# =============================================================================
+# CONTROLLER LOOKUP INDEXES
+# =============================================================================
+
+_HEX_ID_RE = re.compile(r"0x([0-9a-f]+)")
+
+# Names that look like some kind of controller even if nothing else matched
+_GENERIC_KEYWORDS_RE = re.compile(r"controller|gamepad|joystick|joypad|game pad", re.IGNORECASE)
+
+def _norm_vid(value):
+    """Canonical '0x057e' form of a USB id ('0x057E', 1406, '0x057e  (Nintendo Co., Ltd.)')"""
+    if isinstance(value, str):
+        if not value:
+            return ""
+        m = _HEX_ID_RE.search(value.lower())
+    elif isinstance(value, int):
+        return f"0x{value:04x}"
+    else:
+        m = _HEX_ID_RE.search(str(value).lower())
+    if not m:
+        return ""
+    # Already four hex digits (the usual case) -> use the match as-is
+    token = m.group()
+    return token if len(token) == 6 else f"0x{int(m.group(1), 16):04x}"
+
+class Entry(NamedTuple):
+    """Read-only view of one database entry, as used by identification"""
+    name: str
+    year: int
+    vendor_ids: tuple
+    product_patterns: tuple
+    product_ids: tuple
+    n64_map: object
+    auto_detect: bool
+    buttons: tuple
+
+# Identification only needs ids and patterns, so those are pulled out of the
+# entries into parallel arrays (row i = i-th database entry; ids normalized
+# with _norm_vid, patterns lowercased):
+#   _KEYS, _VID_SETS, _PATTERNS, _PID_SETS
+# plus lookup indexes built from them:
+#   _ENTRIES:        controller key -> Entry (read-only mapping)
+#   _EXACT_INDEX:    (vendor id, product id) -> controller key
+#   _VENDOR_INDEX:   vendor id -> [rows], in database order
+#   _PATTERN_INDEX:  [(product pattern, row)]
+#   _PATTERN_REGEX:  every product pattern as one alternation, one group each,
+#                    in a lookahead so overlapping matches are all reported
+#   _GROUP_TO_KEY:   regex group number - 1 -> controller key
+# All of these are built by _lazy_init() on the first identification.
+_INDEXES = None
+
+def _lazy_init():
+    """Build the lookup indexes from _controller_db() once"""
+    global _INDEXES, _ENTRIES, _KEYS, _VID_SETS, _PATTERNS, _PID_SETS
+    global _EXACT_INDEX, _VENDOR_INDEX, _PATTERN_INDEX, _PATTERN_REGEX, _GROUP_TO_KEY
+    if _INDEXES is not None:
+        return
+    
+    db = _controller_db()
+    _ENTRIES = MappingProxyType({
+        key: Entry(
+            data["name"], data["year"],
+            data.get("vendor_ids", ()), data.get("product_patterns", ()), data.get("product_ids", ()),
+            data.get("n64_map", {}), data.get("auto_detect", False), data.get("buttons", ())
+        )
+        for key, data in db.items()
+    })
+    _KEYS = [sys.intern(key) for key in db]
+    _VID_SETS = [frozenset(sys.intern(_norm_vid(vid)) for vid in data.get("vendor_ids", ()))
+                 for data in db.values()]
+    _PATTERNS = [tuple(sys.intern(pattern.lower()) for pattern in data.get("product_patterns", ()))
+                 for data in db.values()]
+    _PID_SETS = [frozenset(sys.intern(_norm_vid(pid)) for pid in data.get("product_ids", ()))
+                 for data in db.values()]
+    
+    _EXACT_INDEX = {}
+    _VENDOR_INDEX = {}
+    _PATTERN_INDEX = []
+    for row, (vids, patterns, pids) in enumerate(zip(_VID_SETS, _PATTERNS, _PID_SETS)):
+        for vid in vids:
+            _VENDOR_INDEX.setdefault(vid, []).append(row)
+            for pid in pids:
+                _EXACT_INDEX.setdefault((vid, pid), _KEYS[row])
+        _PATTERN_INDEX.extend((pattern, row) for pattern in patterns)
+    
+    # Patterns are already lowercased, so this is searched against name.lower().
+    # Groups follow database order, so a lower group number is an earlier entry.
+    _PATTERN_REGEX = re.compile("(?=%s)" %
+        "|".join(f"(?P<g{g}>{re.escape(pattern)})" for g, (pattern, _) in enumerate(_PATTERN_INDEX))
+    )
+    _GROUP_TO_KEY = [_KEYS[row] for _, row in _PATTERN_INDEX]
+    
+    _INDEXES = _ENTRIES
+
+def _make_hit(key, entry, name, vendor_id, product_id):
+    """Build the detected-controller dict for a database Entry"""
+    return {
+        "id": key,
+        "name": entry.name,
+        "year": entry.year,
+        "detected_name": name,
+        "vendor_id": vendor_id,
+        "product_id": product_id,
+        "n64_map": entry.n64_map,
+        "auto_detect": entry.auto_detect
     }
-}
 
 # =============================================================================
 # CONTROLLER DETECTION
@@ -491,41 +654,65 @@ CONTROLLER_DATABASE = {
 class ControllerManager:
     """Manages controller detection and mapping"""
     
+    __slots__ = ("detected_controllers", "_active_controller", "config_dir",
+                 "_cache", "_cache_time", "_ttl", "_cached_config", "_cached_config_for")
+    
     def __init__(self):
         self.detected_controllers = []
-        self.active_controller = None
+        # get_retroarch_config() text, valid while _cached_config_for is
+        # still the active controller
+        self._cached_config = None
+        self._cached_config_for = None
+        self._active_controller = None
         self.config_dir = PATHS.get("config_dir") if PATHS else None
+        # detect_all() results are reused for _ttl seconds so repeated
+        # callers don't re-run system_profiler
+        self._cache = None
+        self._cache_time = 0.0
+        self._ttl = 2.0
+    
+    @property
+    def active_controller(self):
+        return self._active_controller
+    
+    @active_controller.setter
+    def active_controller(self, controller):
+        self._active_controller = controller
+        self._cached_config = None
+        self._cached_config_for = None
+    
+    def invalidate(self):
+        """Drop cached detection results so the next detect_all() rescans"""
+        self._cache = None
     
     def detect_controllers_macos(self):
         """Detect controllers on macOS using system_profiler"""
         controllers = []
         
+        procs = []
         try:
-            # Get USB devices
-            result = subprocess.run(
-                ["system_profiler", "SPUSBDataType", "-json"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # Start the USB and Bluetooth queries together, they're independent
+            for data_type in ("SPUSBDataType", "SPBluetoothDataType"):
+                procs.append(subprocess.Popen(
+                    ["system_profiler", data_type, "-json"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                ))
+            p_usb, p_bt = procs
+            usb_out, _ = p_usb.communicate(timeout=10)
+            bt_out, _ = p_bt.communicate(timeout=10)
             
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
+            # Get USB devices
+            if p_usb.returncode == 0:
+                data = _json_loads(usb_out)
                 usb_items = data.get("SPUSBDataType", [])
                 
                 for bus in usb_items:
                     self._scan_usb_tree(bus, controllers)
             
             # Also check Bluetooth
-            result = subprocess.run(
-                ["system_profiler", "SPBluetoothDataType", "-json"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
+            if p_bt.returncode == 0:
+                data = _json_loads(bt_out)
                 bt_data = data.get("SPBluetoothDataType", [])
                 
                 for bt in bt_data:
@@ -539,157 +726,164 @@ class ControllerManager:
         
         except Exception as e:
             print(f"[Controller] Detection error: {e}")
+        finally:
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
         
         return controllers
     
-    def _scan_usb_tree(self, node, controllers, depth=0):
-        """Recursively scan USB device tree"""
-        if isinstance(node, dict):
+    def _scan_usb_tree(self, root, controllers):
+        """Scan USB device tree (iterative, same order as a recursive walk)"""
+        identify = self._identify_controller
+        pending = deque([root])
+        while pending:
+            node = pending.pop()
+            if not isinstance(node, dict):
+                continue
             name = node.get("_name", "")
             vendor_id = node.get("vendor_id", "")
             product_id = node.get("product_id", "")
             
-            controller = self._identify_controller(name, vendor_id, product_id)
+            controller = identify(name, vendor_id, product_id)
             if controller:
                 controller["connection"] = "USB"
                 controllers.append(controller)
             
-            # Scan children
-            items = node.get("_items", [])
-            for item in items:
-                self._scan_usb_tree(item, controllers, depth + 1)
+            # Scan children, reversed so the first child comes off next
+            items = node.get("_items", ())
+            pending.extend(reversed(items))
     
     def _identify_controller(self, name, vendor_id, product_id):
         """Identify controller from database"""
+        if _INDEXES is None:
+            _lazy_init()
+        entries = _INDEXES
+        vid_norm = _norm_vid(vendor_id)
+        pid_norm = _norm_vid(product_id)
+        
+        # An exact vendor/product id pair is the most specific match
+        key = _EXACT_INDEX.get((vid_norm, pid_norm))
+        if key is not None:
+            return _make_hit(key, entries[key], name, vendor_id, product_id)
+        
         name_lower = name.lower()
         
-        # Check each controller in database
-        for key, data in CONTROLLER_DATABASE.items():
-            # Check product patterns
-            patterns = data.get("product_patterns", [])
-            for pattern in patterns:
-                if pattern.lower() in name_lower:
-                    return {
-                        "id": key,
-                        "name": data["name"],
-                        "year": data["year"],
-                        "detected_name": name,
-                        "vendor_id": vendor_id,
-                        "product_id": product_id,
-                        "n64_map": data.get("n64_map", {}),
-                        "auto_detect": data.get("auto_detect", False)
-                    }
-            
-            # Check vendor IDs
-            vendor_ids = data.get("vendor_ids", [])
-            for vid in vendor_ids:
-                if vid.lower() in str(vendor_id).lower():
-                    # Check product IDs if available
-                    product_ids = data.get("product_ids", [])
-                    if product_ids:
-                        for pid in product_ids:
-                            if pid.lower() in str(product_id).lower():
-                                return {
-                                    "id": key,
-                                    "name": data["name"],
-                                    "year": data["year"],
-                                    "detected_name": name,
-                                    "vendor_id": vendor_id,
-                                    "product_id": product_id,
-                                    "n64_map": data.get("n64_map", {}),
-                                    "auto_detect": data.get("auto_detect", False)
-                                }
-                    else:
-                        return {
-                            "id": key,
-                            "name": data["name"],
-                            "year": data["year"],
-                            "detected_name": name,
-                            "vendor_id": vendor_id,
-                            "product_id": product_id,
-                            "n64_map": data.get("n64_map", {}),
-                            "auto_detect": data.get("auto_detect", False)
-                        }
+        # A product name match identifies the controller outright. The
+        # earliest database entry wins, not the earliest position in the
+        # name, so "Controller (XBOX 360 For Windows)" is xbox_360 rather
+        # than generic_xinput's "controller".
+        group = min((m.lastindex for m in _PATTERN_REGEX.finditer(name_lower)), default=None)
+        if group is not None:
+            key = _GROUP_TO_KEY[group - 1]
+            return _make_hit(key, entries[key], name, vendor_id, product_id)
+        
+        # Otherwise fall back to vendor ids (earliest database entry wins)
+        for row in _VENDOR_INDEX.get(vid_norm, ()):
+            # Check product IDs if available
+            product_ids = _PID_SETS[row]
+            if not product_ids or pid_norm in product_ids:
+                key = _KEYS[row]
+                return _make_hit(key, entries[key], name, vendor_id, product_id)
         
         # Check for generic controller keywords
-        controller_keywords = ["controller", "gamepad", "joystick", "joypad", "game pad"]
-        for keyword in controller_keywords:
-            if keyword in name_lower:
-                return {
-                    "id": "generic_xinput",
-                    "name": f"Unknown Controller ({name})",
-                    "year": 2000,
-                    "detected_name": name,
-                    "vendor_id": vendor_id,
-                    "product_id": product_id,
-                    "n64_map": CONTROLLER_DATABASE["generic_xinput"]["n64_map"],
-                    "auto_detect": False
-                }
+        if _GENERIC_KEYWORDS_RE.search(name):
+            hit = _make_hit("generic_xinput", entries["generic_xinput"], name, vendor_id, product_id)
+            hit["name"] = f"Unknown Controller ({name})"
+            hit["year"] = 2000
+            return hit
         
         return None
     
     def detect_all(self):
         """Detect all connected controllers"""
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_time < self._ttl:
+            return self._cache
+        
         print("[Controller] Scanning for controllers...")
         
         if SYS_OS == "darwin":
-            self.detected_controllers = self.detect_controllers_macos()
+            controllers = self.detect_controllers_macos()
         else:
             # Fallback for other platforms
-            self.detected_controllers = []
+            controllers = []
         
-        # Sort by priority (auto_detect controllers first)
-        self.detected_controllers.sort(key=lambda c: (not c.get("auto_detect", False), c.get("year", 2000)))
+        # Sort by priority (auto_detect controllers first). Every entry comes
+        # from _make_hit, so both keys are always present.
+        controllers.sort(key=lambda c: (not c["auto_detect"], c["year"]))
+        self.detected_controllers = controllers
         
-        # Auto-select first auto_detect controller, or first controller
-        if self.detected_controllers:
-            for controller in self.detected_controllers:
-                if controller.get("auto_detect"):
-                    self.active_controller = controller
-                    break
-            if not self.active_controller:
-                self.active_controller = self.detected_controllers[0]
+        # Auto-select first auto_detect controller, or first controller.
+        # After the sort an auto_detect controller, if any, is controllers[0].
+        if controllers and (controllers[0]["auto_detect"] or not self.active_controller):
+            self.active_controller = controllers[0]
         
-        count = len(self.detected_controllers)
+        count = len(controllers)
         print(f"[Controller] Found {count} controller(s)")
         
-        for c in self.detected_controllers:
-            auto = "★" if c.get("auto_detect") else ""
+        for c in controllers:
+            auto = "★" if c["auto_detect"] else ""
             print(f"  → {c['name']} ({c['year']}) [{c['connection']}] {auto}")
         
         if self.active_controller:
             print(f"[Controller] Active: {self.active_controller['name']}")
         
-        return self.detected_controllers
+        self._cache = controllers
+        # The scan itself takes seconds; the TTL starts when it finishes
+        self._cache_time = time.monotonic()
+        return controllers
     
     def get_retroarch_config(self):
         """Generate RetroArch controller config for active controller"""
         if not self.active_controller:
             return None
         
-        n64_map = self.active_controller.get("n64_map", {})
+        ac = self.active_controller
+        if ac is self._cached_config_for:
+            return self._cached_config
+        
+        n64_map = ac.get("n64_map", {})
         
         if n64_map == "native":
             # N64 controller, no mapping needed
-            return None
+            config = None
+        else:
+            config = self._build_retroarch_config(ac, n64_map)
+        
+        self._cached_config = config
+        self._cached_config_for = ac
+        return config
+    
+    def _build_retroarch_config(self, ac, n64_map):
+        """RetroArch input_player1_* text for a controller's n64_map"""
+        g = n64_map.get
+        a = g("a", "a")
+        b = g("b", "b")
+        st = g("start", "start")
+        l = g("l", "l")
+        r = g("r", "r")
+        z = g("z", "l2")
         
         # RetroArch uses input_player1_* settings
         # This is a simplified version - full implementation would need SDL button indices
-        config = f"""
-# Auto-generated by Cat's HLE 1.3
-# Controller: {self.active_controller['name']}
-# Detected: {self.active_controller.get('detected_name', 'Unknown')}
-
-input_player1_a = "{n64_map.get('a', 'a')}"
-input_player1_b = "{n64_map.get('b', 'b')}"
-input_player1_start = "{n64_map.get('start', 'start')}"
-input_player1_l = "{n64_map.get('l', 'l')}"
-input_player1_r = "{n64_map.get('r', 'r')}"
-input_player1_l2 = "{n64_map.get('z', 'l2')}"
-"""
-        return config
+        return "\n".join((
+            "",
+            "# Auto-generated by Cat's HLE 1.3",
+            f"# Controller: {ac['name']}",
+            f"# Detected: {ac.get('detected_name', 'Unknown')}",
+            "",
+            f'input_player1_a = "{a}"',
+            f'input_player1_b = "{b}"',
+            f'input_player1_start = "{st}"',
+            f'input_player1_l = "{l}"',
+            f'input_player1_r = "{r}"',
+            f'input_player1_l2 = "{z}"',
+            "",
+        ))
 
-# Global controller manager - initialized later after PATHS is set
+# Global controller manager - initialized by the GUI on startup
 controller_manager = None
 
 def init_controller_manager():
@@ -701,27 +895,85 @@ def init_controller_manager():
 # =============================================================================
 
 def get_binary_arch(binary_path):
-    if SYS_OS != "darwin" or not Path(binary_path).exists():
+    if SYS_OS != "darwin":
         return None
     
+    # Cached per (path, mtime); a replaced binary is parsed again
+    binary_path = str(binary_path)
     try:
-        result = subprocess.run(
-            ["lipo", "-archs", str(binary_path)],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        archs = result.stdout.strip().split()
-        
-        if "arm64" in archs and "x86_64" in archs:
-            return "universal"
-        elif "arm64" in archs:
-            return "arm64"
-        elif "x86_64" in archs:
-            return "x86_64"
+        mtime = os.stat(binary_path).st_mtime_ns
+    except OSError:
         return None
-    except:
+    return _binary_arch(binary_path, mtime)
+
+_MACHO_CPU_TYPES = {
+    7: "i386",
+    0x01000007: "x86_64",
+    12: "arm",
+    0x0100000C: "arm64",
+}
+
+def _read_macho_archs(binary_path):
+    """
+    Read the architectures of a Mach-O binary straight from its header.
+    Returns a list like lipo -archs, or None if the magic isn't Mach-O.
+    """
+    with open(binary_path, "rb") as f:
+        header = f.read(4096)
+    if len(header) < 8:
         return None
+    
+    magic = struct.unpack(">I", header[:4])[0]
+    
+    # Fat (universal) headers are always big-endian
+    if magic in (0xCAFEBABE, 0xCAFEBABF):
+        entry_size = 20 if magic == 0xCAFEBABE else 32
+        nfat_arch = struct.unpack(">I", header[4:8])[0]
+        archs = []
+        for i in range(nfat_arch):
+            offset = 8 + i * entry_size
+            if offset + 4 > len(header):
+                break
+            cputype = struct.unpack(">I", header[offset:offset + 4])[0]
+            archs.append(_MACHO_CPU_TYPES.get(cputype, hex(cputype)))
+        return archs
+    
+    # Thin binaries: cputype follows the magic, in the file's byte order
+    if magic in (0xFEEDFACE, 0xFEEDFACF):
+        cputype = struct.unpack(">I", header[4:8])[0]
+    elif magic in (0xCEFAEDFE, 0xCFFAEDFE):
+        cputype = struct.unpack("<I", header[4:8])[0]
+    else:
+        return None
+    return [_MACHO_CPU_TYPES.get(cputype, hex(cputype))]
+
+@functools.lru_cache(maxsize=32)
+def _binary_arch(binary_path, mtime):
+    try:
+        archs = _read_macho_archs(binary_path)
+    except (OSError, struct.error):
+        archs = None
+    
+    # Not something we could parse; ask lipo
+    if archs is None:
+        try:
+            result = subprocess.run(
+                ["lipo", "-archs", binary_path],
+                capture_output=True,
+                timeout=10
+            )
+            # Arch names are plain ASCII; skip the locale-aware text decoding
+            archs = result.stdout.decode("ascii", "ignore").split()
+        except:
+            return None
+    
+    if "arm64" in archs and "x86_64" in archs:
+        return "universal"
+    elif "arm64" in archs:
+        return "arm64"
+    elif "x86_64" in archs:
+        return "x86_64"
+    return None
 
 def get_retroarch_running_arch():
     ra_exe = Path("/Applications/RetroArch.app/Contents/MacOS/RetroArch")
@@ -732,29 +984,23 @@ def get_retroarch_running_arch():
     binary_arch = get_binary_arch(ra_exe)
     
     if binary_arch == "universal":
+        # Read the plists directly instead of forking `defaults read`
         info_plist = Path("/Applications/RetroArch.app/Contents/Info.plist")
         try:
-            result = subprocess.run(
-                ["defaults", "read", str(info_plist), "LSArchitecturePriority"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if "x86_64" in result.stdout:
+            with open(info_plist, "rb") as f:
+                data = plistlib.load(f)
+            if "x86_64" in data.get("LSArchitecturePriority", []):
                 return "x86_64"
-        except:
+        except (OSError, plistlib.InvalidFileException, ValueError):
             pass
         
+        rosetta_plist = HOME / "Library/Preferences/com.apple.rosetta.plist"
         try:
-            result = subprocess.run(
-                ["defaults", "read", "com.apple.rosetta", "RetroArch"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
+            with open(rosetta_plist, "rb") as f:
+                data = plistlib.load(f)
+            if "RetroArch" in data:
                 return "x86_64"
-        except:
+        except (OSError, plistlib.InvalidFileException, ValueError):
             pass
         
         if IS_APPLE_SILICON:
@@ -767,15 +1013,18 @@ def get_retroarch_running_arch():
     
     return MACHINE
 
-RETROARCH_ARCH = None
+@functools.lru_cache(maxsize=1)
+def _retroarch_arch():
+    """Architecture RetroArch runs as, detected once per session
+    (call _retroarch_arch.cache_clear() after changing Rosetta settings)"""
+    return get_retroarch_running_arch()
 
 # =============================================================================
 # PLATFORM PATHS
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_platform_paths():
-    global RETROARCH_ARCH
-    
     ra_version = "1.22.2"
     base_url = f"https://buildbot.libretro.com/stable/{ra_version}/"
     nightly = "https://buildbot.libretro.com/nightly"
@@ -798,11 +1047,12 @@ def get_platform_paths():
         ra_app = retroarch_dir / "RetroArch.app"
         ra_exe = ra_app / "Contents/MacOS/RetroArch"
         
-        RETROARCH_ARCH = get_retroarch_running_arch()
-        arch = RETROARCH_ARCH if RETROARCH_ARCH else ("arm64" if IS_APPLE_SILICON else "x86_64")
+        # Depends on how RetroArch runs (lipo/plists), so it's filled in by
+        # get_core_arch() when a core is actually installed
+        arch = None
         
         ra_url = f"{base_url}apple/osx/universal/RetroArch_Metal.dmg"
-        core_urls = [("mupen64plus_next", f"{nightly}/apple/osx/{arch}/latest/mupen64plus_next_libretro.dylib.zip")]
+        core_urls = None
         core_ext = ".dylib"
 
     else:  # Linux
@@ -819,51 +1069,126 @@ def get_platform_paths():
         "retroarch_dir": retroarch_dir,
         "config_dir": config_dir,
         "cores_dir": cores_dir,
-        "ra_exe": Path(ra_exe),
-        "ra_app": retroarch_dir / "RetroArch.app" if SYS_OS == "darwin" else None,
+        # Resolved here once so launches don't walk symlinks every time
+        "ra_exe": Path(ra_exe).resolve(),
+        "ra_app": (retroarch_dir / "RetroArch.app").resolve() if SYS_OS == "darwin" else None,
         "ra_url": ra_url,
         "core_urls": core_urls,
         "core_ext": core_ext,
         "core_arch": arch
     }
 
+def get_core_arch():
+    """Core architecture to install; resolved on first call on macOS"""
+    if PATHS["core_arch"] is None:
+        arch = _retroarch_arch() or ("arm64" if IS_APPLE_SILICON else "x86_64")
+        nightly = "https://buildbot.libretro.com/nightly"
+        PATHS["core_arch"] = arch
+        PATHS["core_urls"] = [("mupen64plus_next", f"{nightly}/apple/osx/{arch}/latest/mupen64plus_next_libretro.dylib.zip")]
+    return PATHS["core_arch"]
+
 PATHS = get_platform_paths()
-PATHS["config_dir"].mkdir(parents=True, exist_ok=True)
-PATHS["cores_dir"].mkdir(parents=True, exist_ok=True)
+for _dir in (PATHS["config_dir"], PATHS["cores_dir"]):
+    if not _dir.exists():
+        _dir.mkdir(parents=True, exist_ok=True)
+del _dir
 
 ROM_DIR = HOME / "Documents/ROMs/N64"
-ROM_DIR.mkdir(parents=True, exist_ok=True)
-
-# Now initialize controller manager after PATHS exists
-init_controller_manager()
+if not ROM_DIR.exists():
+    ROM_DIR.mkdir(parents=True, exist_ok=True)
 
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
 
-def remove_quarantine(path):
+# (path, mtime) of files already cleared this session, so repeat launches
+# skip xattr; a re-downloaded core has a new mtime and is cleared again
+_dequarantined = set()
+
+def remove_quarantine_batch(paths):
     if SYS_OS != "darwin":
         return
+    todo = []
+    for p in paths:
+        try:
+            key = (str(p), os.stat(p).st_mtime_ns)
+        except OSError:
+            continue
+        if key not in _dequarantined:
+            _dequarantined.add(key)
+            todo.append(key[0])
+    if not todo:
+        return
     try:
-        subprocess.run(["xattr", "-rd", "com.apple.quarantine", str(path)], capture_output=True, timeout=10)
+        subprocess.run(["xattr", "-rd", "com.apple.quarantine", *todo], capture_output=True, timeout=10)
     except:
         pass
 
+def remove_quarantine(path):
+    remove_quarantine_batch((path,))
+
+# (path, mtime) of cores already made executable this session; a core
+# re-extracted to the same path has a new mtime and is checked again
+_executable_cores = set()
+
 def fix_core_permissions(core_path):
-    if not core_path or not core_path.exists():
+    if not core_path:
+        return
+    try:
+        key = (str(core_path), os.stat(core_path).st_mtime_ns)
+    except OSError:
         return
     remove_quarantine(core_path)
+    if key in _executable_cores:
+        return
     try:
-        os.chmod(core_path, 0o755)
+        if not os.access(core_path, os.X_OK):
+            os.chmod(core_path, 0o755)
+        _executable_cores.add(key)
     except:
         pass
 
 def verify_core_arch(core_path):
-    if SYS_OS != "darwin" or not core_path or not core_path.exists():
+    if SYS_OS != "darwin" or not core_path:
+        return True, None, None
+    try:
+        mtime = os.stat(core_path).st_mtime_ns
+    except OSError:
         return True, None, None
     
-    core_arch = get_binary_arch(core_path)
-    needed_arch = RETROARCH_ARCH or ("arm64" if IS_APPLE_SILICON else "x86_64")
+    needed_arch = _retroarch_arch() or ("arm64" if IS_APPLE_SILICON else "x86_64")
+    return _verify_core_arch(str(core_path), mtime, needed_arch)
+
+# Sidecar in cores_dir: core file name -> {"arch", "mtime"} for cores we
+# downloaded ourselves, whose arch is known from the URL they came from
+ARCH_SIDECAR = ".arch_cache.json"
+
+def _read_arch_sidecar():
+    try:
+        with open(PATHS["cores_dir"] / ARCH_SIDECAR) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _record_core_arch(core_path, arch):
+    try:
+        sidecar = _read_arch_sidecar()
+        sidecar[Path(core_path).name] = {"arch": arch, "mtime": os.stat(core_path).st_mtime_ns}
+        with open(PATHS["cores_dir"] / ARCH_SIDECAR, "w") as f:
+            json.dump(sidecar, f)
+    except (OSError, TypeError):
+        pass
+
+def _known_core_arch(core_path, mtime):
+    entry = _read_arch_sidecar().get(Path(core_path).name)
+    if isinstance(entry, dict) and entry.get("mtime") == mtime:
+        return entry.get("arch")
+    return None
+
+@functools.lru_cache(maxsize=8)
+def _verify_core_arch(core_path, mtime, needed_arch):
+    # Trust the recorded arch of a core we installed, unless it's been replaced
+    core_arch = _known_core_arch(core_path, mtime) or _binary_arch(core_path, mtime)
     
     if core_arch and needed_arch:
         if core_arch == needed_arch or core_arch == "universal":
@@ -873,35 +1198,85 @@ def verify_core_arch(core_path):
     
     return True, core_arch, needed_arch
 
+# (cores_dir, core_ext) -> (core Path, st_mtime_ns) of the last core found,
+# so repeat lookups skip the permission/quarantine fixups
+_core_cache = {}
+
 def find_n64_core():
+    key = (PATHS["cores_dir"], PATHS["core_ext"])
+    cached = _core_cache.pop(key, None)
+    if cached:
+        core, mtime = cached
+        try:
+            if core.stat().st_mtime_ns == mtime:
+                _core_cache[key] = cached
+                return core
+        except OSError:
+            pass
+    
     for name in ["mupen64plus_next_libretro"]:
         core = PATHS["cores_dir"] / f"{name}{PATHS['core_ext']}"
-        if core.exists():
-            fix_core_permissions(core)
-            return core
+        try:
+            mtime = core.stat().st_mtime_ns
+        except OSError:
+            continue
+        fix_core_permissions(core)
+        _core_cache[key] = (core, mtime)
+        return core
     return None
 
-def download(url, path):
-    if path.exists():
-        return True
-    r = requests.get(url, stream=True, timeout=60)
+DOWNLOAD_CHUNK = 1024 * 1024
+
+_SESSION = None
+
+def _get_session():
+    """Shared keep-alive session (pooled, with retries), created on first download"""
+    global _SESSION
+    if _SESSION is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        # Archives are already compressed; don't ask for gzip on top
+        session.headers["Accept-Encoding"] = "identity"
+        _SESSION = session
+    return _SESSION
+
+def download_fileobj(url, f, progress=None):
+    """Stream url into f; progress(bytes_so_far) is called after each block"""
+    r = _get_session().get(url, stream=True, timeout=60)
     r.raise_for_status()
-    with open(path, "wb") as f:
-        for chunk in r.iter_content(65536):
-            f.write(chunk)
-    return True
+    # Copy the raw stream straight into f in 1 MiB blocks
+    r.raw.decode_content = True
+    if progress is None:
+        shutil.copyfileobj(r.raw, f, DOWNLOAD_CHUNK)
+        return
+    read, write = r.raw.read, f.write
+    done = 0
+    while True:
+        block = read(DOWNLOAD_CHUNK)
+        if not block:
+            break
+        write(block)
+        done += len(block)
+        progress(done)
 
-def install_core():
+def install_core(progress=None):
     core = find_n64_core()
     if core:
         is_valid, core_arch, needed_arch = verify_core_arch(core)
         if not is_valid:
             core.unlink()
-            return install_core_forced(needed_arch)
+            _core_cache.clear()
+            return install_core_forced(needed_arch, progress)
         return core
-    return install_core_forced(PATHS.get("core_arch", "arm64"))
+    return install_core_forced(get_core_arch() or "arm64", progress)
 
-def install_core_forced(arch):
+def install_core_forced(arch, progress=None):
     nightly = "https://buildbot.libretro.com/nightly"
     
     if SYS_OS == "darwin":
@@ -912,15 +1287,22 @@ def install_core_forced(arch):
         url = f"{nightly}/linux/{arch}/latest/mupen64plus_next_libretro.so.zip"
     
     try:
-        zip_path = PATHS["cores_dir"] / "mupen64plus_next.zip"
-        if zip_path.exists():
-            zip_path.unlink()
+        # The zip is spooled in memory (disk only past 8 MiB) and extracted
+        # from there, so it's never written out and deleted again
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as spool:
+            download_fileobj(url, spool, progress)
+            spool.seek(0)
+            with zipfile.ZipFile(spool) as z:
+                # Only the core library is needed, not the rest of the archive
+                name = next((n for n in z.namelist() if n.endswith(PATHS["core_ext"])), None)
+                if name is None:
+                    raise FileNotFoundError(f"no {PATHS['core_ext']} in {url}")
+                dest = PATHS["cores_dir"] / Path(name).name
+                with z.open(name) as src, open(dest, "wb", buffering=DOWNLOAD_CHUNK) as dst:
+                    shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK)
         
-        download(url, zip_path)
-        
-        with zipfile.ZipFile(zip_path) as z:
-            z.extractall(PATHS["cores_dir"])
-        zip_path.unlink()
+        if SYS_OS == "darwin":
+            _record_core_arch(dest, arch)
         
         core = find_n64_core()
         if core:
@@ -938,7 +1320,7 @@ def install_core_forced(arch):
 def is_running_rosetta():
     if not IS_APPLE_SILICON:
         return False
-    return RETROARCH_ARCH == "x86_64"
+    return _retroarch_arch() == "x86_64"
 
 def setup_renderer_config(config_dir):
     if not config_dir:
@@ -966,6 +1348,13 @@ mupen64plus-cpucore = "dynamic_recompiler"
 mupen64plus-EnableHWLighting = "True"
 '''
     
+    # Compare first so a steady-state launch is just one read
+    try:
+        if core_opts_file.read_text() == core_opts:
+            return
+    except OSError:
+        pass
+    
     try:
         core_opts_file.write_text(core_opts)
     except:
@@ -976,14 +1365,36 @@ def setup_video_driver(config_dir):
         return
     
     config_file = config_dir / "config" / "retroarch.cfg"
-    if not config_file.exists():
+    # Holds the cfg's st_mtime_ns from the last check; if it still matches,
+    # the file hasn't changed since and there's nothing to patch
+    sentinel = config_dir / ".video_driver_patched"
+    
+    try:
+        mtime = str(config_file.stat().st_mtime_ns)
+    except OSError:
         return
     
     try:
-        content = config_file.read_text()
-        if 'video_driver = "gl"' in content:
+        if sentinel.read_text() == mtime:
+            return
+    except OSError:
+        pass
+    
+    try:
+        # Cheap byte scan first; only decode and rewrite if "gl" is there
+        with open(config_file, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    needs_patch = mm.find(b'video_driver = "gl"') != -1
+            except ValueError:  # empty file
+                needs_patch = False
+        
+        if needs_patch:
+            content = config_file.read_text()
             content = content.replace('video_driver = "gl"', 'video_driver = "glcore"')
             config_file.write_text(content)
+            mtime = str(config_file.stat().st_mtime_ns)
+        sentinel.write_text(mtime)
     except:
         pass
 
@@ -991,42 +1402,83 @@ def setup_video_driver(config_dir):
 # ROM LAUNCHER
 # =============================================================================
 
+RA_BUNDLE_ID = "com.libretro.RetroArch"
+
+def _wait_for_retroarch(timeout=0.5):
+    """Wait (at most timeout) for RetroArch to register as a running app"""
+    if NSRunningApplication is None:
+        # No way to ask without AppKit; fall back to a fixed delay
+        time.sleep(timeout)
+        return
+    for _ in range(int(timeout / 0.025)):
+        try:
+            if NSRunningApplication.runningApplicationsWithBundleIdentifier_(RA_BUNDLE_ID):
+                return
+        except Exception:
+            break
+        time.sleep(0.025)
+
 def bring_to_front():
     if SYS_OS != "darwin":
         return
+    if NSRunningApplication is not None:
+        try:
+            apps = NSRunningApplication.runningApplicationsWithBundleIdentifier_(RA_BUNDLE_ID)
+            if apps:
+                apps[0].activateWithOptions_(NSApplicationActivateIgnoringOtherApps)
+            return
+        except Exception as e:
+            print(f"[Launch] AppKit activation failed: {e}")
     try:
         subprocess.run(["osascript", "-e", 'tell application "RetroArch" to activate'], capture_output=True, timeout=5)
     except:
         pass
 
+_LAUNCH_ENV_OVERLAY = None
+
+def _launch_env():
+    """Environment for RetroArch, or None to inherit ours unchanged"""
+    global _LAUNCH_ENV_OVERLAY
+    if _LAUNCH_ENV_OVERLAY is None:
+        overlay = {}
+        if "DISPLAY" not in os.environ:
+            overlay["DISPLAY"] = ":0"
+        if IS_APPLE_SILICON:
+            overlay["MTL_HUD_ENABLED"] = "0"
+        _LAUNCH_ENV_OVERLAY = overlay
+    if not _LAUNCH_ENV_OVERLAY:
+        return None
+    return {**os.environ, **_LAUNCH_ENV_OVERLAY}
+
+# Set once RetroArch has launched, so later launches skip the exists() check
+_ra_exe_found = False
+
 def launch_rom_macos(rom_path, core_path):
+    global _ra_exe_found
     ra_exe = PATHS["ra_exe"]
     ra_app = PATHS.get("ra_app")
     config_dir = PATHS.get("config_dir")
     
-    if not ra_exe.exists():
+    if not _ra_exe_found and not ra_exe.exists():
         return False, "RetroArch not installed"
     
-    if ra_app and ra_app.exists():
-        remove_quarantine(ra_app)
-    remove_quarantine(core_path)
+    # Missing paths are skipped by remove_quarantine_batch
+    remove_quarantine_batch((ra_app, core_path) if ra_app else (core_path,))
     
     setup_renderer_config(config_dir)
     setup_video_driver(config_dir)
     
+    # ra_exe is pre-resolved and the core lives under cores_dir; only the ROM
+    # needs a real path lookup
     rom_path = Path(rom_path).resolve()
-    core_path = Path(core_path).resolve()
+    core_path = os.path.abspath(core_path)
     
-    cmd = [str(ra_exe), "-L", str(core_path), "--verbose", str(rom_path)]
+    cmd = (str(ra_exe), "-L", core_path, "--verbose", str(rom_path))
     
     try:
-        env = os.environ.copy()
-        env["DISPLAY"] = env.get("DISPLAY", ":0")
-        if IS_APPLE_SILICON:
-            env["MTL_HUD_ENABLED"] = "0"
-        
-        subprocess.Popen(cmd, env=env)
-        time.sleep(0.5)
+        subprocess.Popen(cmd, env=_launch_env())
+        _ra_exe_found = True
+        _wait_for_retroarch()
         bring_to_front()
         
         return True, None
@@ -1056,6 +1508,149 @@ def launch_rom(rom_path, core_path):
     else:
         return launch_rom_direct(rom_path, core_path)
 
+# =============================================================================
+# ROM SCANNING
+# =============================================================================
+
+ROM_EXTENSIONS = frozenset({".z64", ".n64", ".v64"})
+
+# Country tag in a ROM filename, e.g. "Mario Kart 64 (E)"; first tag wins
+_COUNTRY_RE = re.compile(r"\((J|Japan|E|Europe|U|USA)\)")
+_COUNTRY_MAP = {
+    "J": "Japan", "Japan": "Japan",
+    "E": "Europe", "Europe": "Europe",
+    "U": "USA", "USA": "USA",
+}
+
+# (rom_dir, rom_dir st_mtime_ns) -> [(Path, size, country, rom_type)], sorted.
+# Adding/removing/renaming a ROM bumps the directory mtime, which misses.
+_rom_scan_cache = {}
+
+def scan_roms(rom_dir):
+    try:
+        key = (rom_dir, rom_dir.stat().st_mtime_ns)
+    except OSError:
+        return []
+    cached = _rom_scan_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    # One directory pass; DirEntry caches type and stat info from the scan
+    with os.scandir(rom_dir) as it:
+        entries = [e for e in it
+                   if os.path.splitext(e.name)[1].lower() in ROM_EXTENSIONS and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    
+    record, path_cls = _rom_record, Path
+    result = [record(path_cls(entry.path), entry.stat()) for entry in entries]
+    
+    # Only the current state of each directory is worth keeping
+    invalidate_rom_scan(rom_dir)
+    _rom_scan_cache[key] = result
+    return result
+
+def _rom_record(rom, st):
+    # Country from the filename tag if there is one, else the ROM header
+    m = _COUNTRY_RE.search(rom.stem)
+    if m:
+        country = _COUNTRY_MAP[m.group(1)]
+    else:
+        country = parse_rom_meta(str(rom), st.st_mtime_ns)[0] or "USA"
+    
+    # Detect type from extension
+    rom_type = rom.suffix.upper()[1:]
+    
+    return (rom, st.st_size, country, rom_type)
+
+# First header word in each dump byte order
+_ROM_MAGIC = {
+    b"\x80\x37\x12\x40": "Z64",  # big-endian (native)
+    b"\x37\x80\x40\x12": "V64",  # 16-bit byte-swapped
+    b"\x40\x12\x37\x80": "N64",  # 32-bit little-endian
+}
+
+# Destination code, the last byte of the game ID at header offset 0x3E
+_HEADER_COUNTRIES = {
+    "A": "Asia", "B": "Brazil", "C": "China", "D": "Germany",
+    "E": "USA", "F": "France", "H": "Netherlands", "I": "Italy",
+    "J": "Japan", "K": "Korea", "N": "Canada", "P": "Europe",
+    "S": "Spain", "U": "Australia", "W": "Scandinavia",
+    "X": "Europe", "Y": "Europe", "Z": "Europe",
+}
+
+@functools.lru_cache(maxsize=4096)
+def parse_rom_meta(path_str, mtime_ns):
+    """(country, byte order, game ID) from a ROM's 64-byte header.
+    
+    mtime_ns is only part of the cache key, so an edited ROM is re-read.
+    Fields are None when the file can't be read or isn't an N64 ROM.
+    """
+    try:
+        with open(path_str, "rb") as f:
+            header = f.read(64)
+    except OSError:
+        return (None, None, None)
+    rom_format = _ROM_MAGIC.get(header[:4])
+    if rom_format is None or len(header) < 64:
+        return (None, None, None)
+    
+    # Normalize to big-endian
+    if rom_format == "V64":
+        swapped = bytearray(64)
+        swapped[0::2] = header[1::2]
+        swapped[1::2] = header[0::2]
+        header = bytes(swapped)
+    elif rom_format == "N64":
+        header = b"".join(header[i:i + 4][::-1] for i in range(0, 64, 4))
+    
+    game_id = header[0x3B:0x3F].decode("ascii", "replace")
+    return (_HEADER_COUNTRIES.get(chr(header[0x3E])), rom_format, game_id)
+
+def add_scanned_roms(rom_dir, roms, pre_copy_mtime):
+    """Fold newly added ROM files into the cached scan of rom_dir.
+    
+    pre_copy_mtime is rom_dir's st_mtime_ns from before the copy. The
+    cached scan is only extended if it was taken at that mtime; otherwise
+    something else changed the folder too, and re-keying the old scan to
+    the new mtime would hide those files for good.
+    
+    Returns the new records, or None when there is no up-to-date cached
+    scan to extend (the caller should fall back to scan_roms).
+    """
+    cached = (rom_dir, pre_copy_mtime)
+    if cached not in _rom_scan_cache:
+        invalidate_rom_scan(rom_dir)
+        return None
+    try:
+        key = (rom_dir, rom_dir.stat().st_mtime_ns)
+    except OSError:
+        return None
+    
+    records = [_rom_record(rom, rom.stat()) for rom in roms
+               if rom.suffix.lower() in ROM_EXTENSIONS]
+    result = _rom_scan_cache.pop(cached) + records
+    result.sort(key=lambda r: r[0].name)
+    _rom_scan_cache[key] = result
+    return records
+
+# ROM dumps come in a handful of exact sizes, so every row shares one of
+# a few label strings. Keyed on the exact byte count, not a bucket, so a
+# label is always what f"{size_mb:.1f} MB" would have printed.
+_size_labels = {}
+
+def _size_label(size):
+    label = _size_labels.get(size)
+    if label is None:
+        label = _size_labels[size] = "%.1f MB" % (size / (1024 * 1024))
+    return label
+
+# Save type and status columns: placeholders, the same for every ROM
+_ROW_CONST_SUFFIX = ("EEPROM", "Unknown")
+
+def invalidate_rom_scan(rom_dir):
+    for old in [k for k in _rom_scan_cache if k[0] == rom_dir]:
+        del _rom_scan_cache[old]
+
 # =============================================================================
 # GUI — PROJECT64 1.0 STYLE
 # =============================================================================
@@ -1076,6 +1671,11 @@ class CatsHLE(tk.Tk):
         
         self.core = None
         self.current_rom = None
+        self._db_window = None
+        self._installing = False  # the startup worker is still running
+        
+        if controller_manager is None:
+            init_controller_manager()
         
         self.setup_menu()
         self.setup_toolbar()
@@ -1188,10 +1788,20 @@ class CatsHLE(tk.Tk):
         self.rom_list.column("type", width=80, minwidth=60)
         self.rom_list.column("status", width=80, minwidth=60)
         
-        # Scrollbars
-        y_scroll = ttk.Scrollbar(browser_frame, orient=tk.VERTICAL, command=self.rom_list.yview)
+        # Scrollbars. Only the rows in view exist in the Treeview (see
+        # _render_rom_window), so the vertical scrollbar is driven by us
+        # against the full ROM list rather than by the widget.
+        y_scroll = ttk.Scrollbar(browser_frame, orient=tk.VERTICAL, command=self._on_rom_scroll)
         x_scroll = ttk.Scrollbar(browser_frame, orient=tk.HORIZONTAL, command=self.rom_list.xview)
-        self.rom_list.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        self.rom_list.configure(xscrollcommand=x_scroll.set)
+        self._rom_yscroll = y_scroll
+        
+        self._all_roms = []        # [(values, rom path str)] for every ROM, sorted
+        self._rom_first = 0        # index of the first row in view
+        self._rom_visible = 30     # rows that fit in the widget (updated on resize)
+        self._rom_rows = set()     # indices currently inserted (iid == str(index))
+        self._rom_selected = None  # index of the selected ROM, kept across scrolling
+        self._rom_row_height = None
         
         # Grid layout
         self.rom_list.grid(row=0, column=0, sticky="nsew")
@@ -1201,10 +1811,126 @@ class CatsHLE(tk.Tk):
         browser_frame.grid_rowconfigure(0, weight=1)
         browser_frame.grid_columnconfigure(0, weight=1)
         
+        # Right-click menu, built once and re-posted on each click
+        self._rom_menu = Menu(self, tearoff=0)
+        self._rom_menu.add_command(label="Play Game", command=self.run_selected)
+        self._rom_menu.add_separator()
+        self._rom_menu.add_command(label="ROM Properties...")
+        self._rom_menu.add_command(label="Edit Game Settings...")
+        
         # Bindings
         self.rom_list.bind("<Double-1>", self.run_selected)
         self.rom_list.bind("<Return>", self.run_selected)
         self.rom_list.bind("<Button-3>", self.show_rom_context_menu)  # Right-click
+        self.rom_list.bind("<Configure>", self._on_rom_resize)
+        self.rom_list.bind("<MouseWheel>", self._on_rom_wheel)
+        self.rom_list.bind("<Button-4>", self._on_rom_wheel)
+        self.rom_list.bind("<Button-5>", self._on_rom_wheel)
+        self.rom_list.bind("<Up>", self._on_rom_key)
+        self.rom_list.bind("<Down>", self._on_rom_key)
+        self.rom_list.bind("<<TreeviewSelect>>", self._on_rom_select)
+    
+    def _render_rom_window(self, refresh=False):
+        """Insert/delete only the rows entering/leaving the visible window.
+        
+        With refresh=True _all_roms has been replaced, so rows that stay
+        in the window are recycled in place with item() rather than being
+        deleted and re-inserted.
+        """
+        n = len(self._all_roms)
+        visible = self._rom_visible
+        first = max(0, min(self._rom_first, n - visible))
+        self._rom_first = first
+        wanted = range(first, min(n, first + visible))
+        
+        rows = self._rom_rows
+        all_roms = self._all_roms
+        insert, item = self.rom_list.insert, self.rom_list.item
+        
+        stale = [str(i) for i in rows if i not in wanted]
+        if stale:
+            self.rom_list.delete(*stale)
+        for pos, i in enumerate(wanted):
+            values, path = all_roms[i]
+            if i not in rows:
+                insert("", pos, iid=str(i), values=values, tags=(path,))
+            elif refresh:
+                item(str(i), values=values, tags=(path,))
+        self._rom_rows = set(wanted)
+        
+        if self._rom_selected in self._rom_rows:
+            iid = str(self._rom_selected)
+            if self.rom_list.selection() != (iid,):
+                self.rom_list.selection_set(iid)
+            self.rom_list.focus(iid)
+        elif refresh and self.rom_list.selection():
+            # A recycled row may still carry the old selection
+            self.rom_list.selection_remove(*self.rom_list.selection())
+        
+        if n:
+            self._rom_yscroll.set(first / n, (first + len(wanted)) / n)
+        else:
+            self._rom_yscroll.set(0.0, 1.0)
+    
+    def _on_rom_scroll(self, action, amount, unit=None):
+        """Scrollbar command: move the window over the full ROM list"""
+        if action == "moveto":
+            self._rom_first = int(float(amount) * len(self._all_roms))
+        else:
+            step = int(amount)
+            if unit == "pages":
+                step *= self._rom_visible
+            self._rom_first += step
+        self._render_rom_window()
+    
+    def _on_rom_wheel(self, event):
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        elif SYS_OS == "darwin":
+            step = -event.delta
+        else:
+            step = -(event.delta // 120)
+        if step:
+            self._on_rom_scroll("scroll", step * 3, "units")
+        return "break"
+    
+    def _on_rom_key(self, event):
+        """Up/Down that keep going past the edge of the rendered rows"""
+        if self._rom_selected is None:
+            return None
+        j = self._rom_selected + (-1 if event.keysym == "Up" else 1)
+        if not 0 <= j < len(self._all_roms):
+            return "break"
+        if j < self._rom_first:
+            self._rom_first = j
+        elif j >= self._rom_first + self._rom_visible:
+            self._rom_first = j - self._rom_visible + 1
+        self._rom_selected = j
+        self._render_rom_window()
+        return "break"
+    
+    def _on_rom_select(self, event):
+        selection = self.rom_list.selection()
+        if selection:
+            self._rom_selected = int(selection[0])
+    
+    def _on_rom_resize(self, event):
+        row_height = self._rom_row_height
+        if row_height is None:
+            children = self.rom_list.get_children()
+            bbox = self.rom_list.bbox(children[0]) if children else ""
+            if bbox:
+                row_height = self._rom_row_height = bbox[3]
+            else:
+                # No row laid out yet; estimate from the font
+                row_height = tkfont.nametofont("TkDefaultFont").metrics("linespace") + 4
+        # One row's worth of height goes to the column headings
+        visible = max(1, event.height // row_height - 1)
+        if visible != self._rom_visible:
+            self._rom_visible = visible
+            self._render_rom_window()
     
     def setup_status_bar(self):
         """Project64-style status bar with multiple sections"""
@@ -1233,13 +1959,34 @@ class CatsHLE(tk.Tk):
     def init_app(self):
         """Initialize application"""
         self.status_left.config(text="Loading core...")
-        self.update()
         
-        # Load core
-        self.core = install_core()
-        
-        # Detect controllers
-        controller_manager.detect_all()
+        # Core install (may download) and controller detection run on a
+        # worker so the event loop keeps painting while they wait on I/O
+        self._installing = True
+        threading.Thread(target=self._bg_init, daemon=True).start()
+    
+    def _bg_init(self):
+        """Worker half of init_app; hands results back to the Tk thread"""
+        core = None
+        try:
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                # Tk calls must happen on the main thread, so progress is posted
+                core_job = ex.submit(install_core, lambda n: self.after(0, self._show_download_progress, n))
+                controllers_job = ex.submit(controller_manager.detect_all)
+                core = core_job.result()
+                controllers_job.result()
+        except Exception as e:
+            print(f"[Init] Background init failed: {e}")
+        self.after(0, self._finish_init, core)
+    
+    def _show_download_progress(self, done):
+        self.status_left.config(text=f"Downloading core... {done / (1024 * 1024):.1f} MB")
+        self.update_idletasks()
+    
+    def _finish_init(self, core):
+        """Apply init results on the Tk thread"""
+        self._installing = False
+        self.core = core
         
         if controller_manager.active_controller:
             self.status_controller.config(text=controller_manager.active_controller["name"])
@@ -1252,40 +1999,41 @@ class CatsHLE(tk.Tk):
         
         self.load_roms()
     
+    @staticmethod
+    def _rom_entry(record):
+        """Scan record -> (row values, path) as kept in _all_roms"""
+        rom, size, country, rom_type = record
+        return (rom.stem, country, _size_label(size)) + _ROW_CONST_SUFFIX, str(rom)
+    
     def load_roms(self):
         """Load ROMs into browser"""
-        self.rom_list.delete(*self.rom_list.get_children())
+        rom_entry = self._rom_entry
+        all_roms = [rom_entry(r) for r in scan_roms(ROM_DIR)]
         
-        extensions = ("*.z64", "*.n64", "*.v64")
-        roms = []
-        for ext in extensions:
-            roms.extend(ROM_DIR.glob(ext))
+        # Swap in the new list, reusing the rows already on screen
+        self._all_roms = all_roms
+        self._rom_selected = None
+        self._render_rom_window(refresh=True)
         
-        for rom in sorted(roms):
-            size_mb = rom.stat().st_size / (1024 * 1024)
-            
-            # Detect country from filename (simple heuristic)
-            name = rom.stem
-            country = "USA"
-            if "(J)" in name or "(Japan)" in name:
-                country = "Japan"
-            elif "(E)" in name or "(Europe)" in name:
-                country = "Europe"
-            elif "(U)" in name or "(USA)" in name:
-                country = "USA"
-            
-            # Detect type from extension
-            rom_type = rom.suffix.upper()[1:]
-            
-            self.rom_list.insert("", "end", values=(
-                name,
-                country,
-                f"{size_mb:.1f} MB",
-                "EEPROM",  # Placeholder
-                "Unknown"
-            ), tags=(str(rom),))
-        
-        count = len(roms)
+        count = len(all_roms)
+        self.status_left.config(text=f"Found {count} ROM(s)")
+    
+    def _insert_rom_rows(self, records):
+        """Merge new scan records into the list, keeping scan order"""
+        selected = None
+        if self._rom_selected is not None:
+            selected = self._all_roms[self._rom_selected][1]
+        
+        self._all_roms.extend(self._rom_entry(r) for r in records)
+        self._all_roms.sort(key=lambda e: os.path.basename(e[1]))
+        if selected is not None:
+            self._rom_selected = next(
+                i for i, e in enumerate(self._all_roms) if e[1] == selected)
+        
+        # Row iids are list indices, which have shifted
+        self._render_rom_window(refresh=True)
+        
+        count = len(self._all_roms)
         self.status_left.config(text=f"Found {count} ROM(s)")
     
     def open_rom(self):
@@ -1294,11 +2042,27 @@ class CatsHLE(tk.Tk):
             title="Open N64 ROM",
             filetypes=[("N64 ROMs", "*.z64 *.n64 *.v64"), ("All files", "*.*")]
         )
+        if not files:
+            return
+        try:
+            pre_copy_mtime = ROM_DIR.stat().st_mtime_ns
+        except OSError:
+            pre_copy_mtime = None
+        added = []
         for src in files:
             dst = ROM_DIR / Path(src).name
             if not dst.exists():
-                shutil.copy2(src, dst)
-        self.load_roms()
+                # ROM metadata doesn't matter; copyfile skips copystat
+                shutil.copyfile(src, dst)
+                added.append(dst)
+        if not added:
+            return
+        
+        records = add_scanned_roms(ROM_DIR, added, pre_copy_mtime)
+        if records is None:
+            self.load_roms()
+        else:
+            self._insert_rom_rows(records)
     
     def open_rom_dir(self):
         """Open ROM directory"""
@@ -1312,30 +2076,31 @@ class CatsHLE(tk.Tk):
         """Change ROM directory"""
         self.open_rom_dir()
     
+    def _still_loading(self):
+        """Tell the user to wait, and return True, while the startup worker runs"""
+        if self._installing:
+            messagebox.showinfo("Still Loading",
+                                "The N64 core and controllers are still loading.\nPlease try again in a moment.")
+        return self._installing
+    
     def run_selected(self, event=None):
         """Run selected ROM"""
-        selection = self.rom_list.selection()
-        if not selection:
-            messagebox.showinfo("No ROM Selected", "Please select a ROM to play")
+        if self._still_loading():
             return
         
-        item = selection[0]
-        rom_name = self.rom_list.item(item)["values"][0]
-        
-        # Find ROM file
-        rom = None
-        for ext in [".z64", ".n64", ".v64"]:
-            candidate = ROM_DIR / f"{rom_name}{ext}"
-            if candidate.exists():
-                rom = candidate
-                break
-        
-        if not rom:
-            messagebox.showerror("ROM Not Found", f"Could not find: {rom_name}")
+        # Only the visible rows exist in the tree, so a selection scrolled
+        # out of view is only remembered in _rom_selected
+        index = self._rom_selected
+        if index is None or not 0 <= index < len(self._all_roms):
+            messagebox.showinfo("No ROM Selected", "Please select a ROM to play")
             return
         
+        values, path = self._all_roms[index]
+        rom_name = values[0]
+        rom = Path(path)
+        
         self.status_left.config(text=f"Starting {rom_name}...")
-        self.update()
+        self.update_idletasks()
         
         ok, err = launch_rom(rom, self.core)
         
@@ -1347,18 +2112,20 @@ class CatsHLE(tk.Tk):
     
     def show_rom_context_menu(self, event):
         """Right-click context menu for ROMs"""
-        menu = Menu(self, tearoff=0)
-        menu.add_command(label="Play Game", command=self.run_selected)
-        menu.add_separator()
-        menu.add_command(label="ROM Properties...")
-        menu.add_command(label="Edit Game Settings...")
-        menu.tk_popup(event.x_root, event.y_root)
+        try:
+            self._rom_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self._rom_menu.grab_release()
     
     def detect_controllers(self):
         """Detect connected controllers"""
+        if self._still_loading():
+            return
+        
         self.status_left.config(text="Scanning for controllers...")
-        self.update()
+        self.update_idletasks()
         
+        controller_manager.invalidate()
         controllers = controller_manager.detect_all()
         
         if controllers:
@@ -1386,19 +2153,28 @@ class CatsHLE(tk.Tk):
     
     def show_controller_database(self):
         """Show all supported controllers"""
-        DatabaseWindow(self)
+        # One window at a time; reopening just brings it back to the front
+        if self._db_window is None or not self._db_window.winfo_exists():
+            self._db_window = DatabaseWindow(self)
+        else:
+            self._db_window.deiconify()
+            self._db_window.lift()
     
     def reinstall_core(self):
         """Reinstall N64 core"""
+        if self._still_loading():
+            return
+        
         self.status_left.config(text="Downloading core...")
-        self.update()
+        self.update_idletasks()
         
         for name in ["mupen64plus_next_libretro"]:
             core = PATHS["cores_dir"] / f"{name}{PATHS['core_ext']}"
             if core.exists():
                 core.unlink()
+                _core_cache.clear()
         
-        self.core = install_core()
+        self.core = install_core(self._show_download_progress)
         
         if self.core:
             self.status_left.config(text=f"Core installed: {self.core.name}")
@@ -1408,40 +2184,49 @@ class CatsHLE(tk.Tk):
     
     def fix_rosetta(self):
         """Fix Rosetta architecture issues"""
-        global RETROARCH_ARCH, PATHS
+        if self._still_loading():
+            return
         
         self.status_left.config(text="Fixing Rosetta...")
-        self.update()
-        
-        # Clear Rosetta preferences
-        try:
-            subprocess.run(["defaults", "delete", "com.apple.rosetta", "RetroArch"], capture_output=True, timeout=5)
-        except:
-            pass
+        self.update_idletasks()
         
+        # Clear Rosetta preferences; the two deletes are independent, so run
+        # them side by side. Their output is never looked at.
+        info_plist = Path("/Applications/RetroArch.app/Contents/Info.plist")
+        procs = []
         try:
-            info_plist = Path("/Applications/RetroArch.app/Contents/Info.plist")
-            subprocess.run(["defaults", "delete", str(info_plist), "LSArchitecturePriority"], capture_output=True, timeout=5)
+            for cmd in (["defaults", "delete", "com.apple.rosetta", "RetroArch"],
+                        ["defaults", "delete", str(info_plist), "LSArchitecturePriority"]):
+                procs.append(subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            for proc in procs:
+                proc.wait(timeout=5)
         except:
             pass
+        finally:
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
         
         # Delete existing cores
         for name in ["mupen64plus_next_libretro"]:
             core = PATHS["cores_dir"] / f"{name}{PATHS['core_ext']}"
             if core.exists():
                 core.unlink()
+                _core_cache.clear()
         
         # Re-detect
-        RETROARCH_ARCH = get_retroarch_running_arch()
-        PATHS = get_platform_paths()
+        _retroarch_arch.cache_clear()
+        if SYS_OS == "darwin":
+            PATHS["core_arch"] = None
         
-        self.core = install_core_forced(RETROARCH_ARCH or "arm64")
+        self.core = install_core_forced(_retroarch_arch() or "arm64", self._show_download_progress)
         
         if self.core:
             renderer = "Angrylion" if is_running_rosetta() else "GLideN64"
             self.status_renderer.config(text=renderer)
             self.status_left.config(text="Rosetta fix applied")
-            messagebox.showinfo("Fixed", f"Architecture: {RETROARCH_ARCH}\nRenderer: {renderer}")
+            messagebox.showinfo("Fixed", f"Architecture: {_retroarch_arch()}\nRenderer: {renderer}")
         else:
             self.status_left.config(text="Fix failed")
             messagebox.showerror("Error", "Failed to fix Rosetta issue")
@@ -1482,6 +2267,8 @@ class ConfigWindow(tk.Toplevel):
         self.title("Configure Controller")
         self.geometry("500x400")
         self.controller_mgr = controller_mgr
+        self._last_scan = 0.0
+        self._scanning = False
         
         self.setup_gui()
     
@@ -1492,15 +2279,13 @@ class ConfigWindow(tk.Toplevel):
         self.controller_var = tk.StringVar()
         controllers = self.controller_mgr.detected_controllers
         
+        self._combo = None
+        self._no_controllers = None
         if controllers:
-            names = [c["name"] for c in controllers]
-            self.controller_var.set(self.controller_mgr.active_controller["name"])
-            
-            combo = ttk.Combobox(self, textvariable=self.controller_var, values=names, state="readonly", width=40)
-            combo.pack(pady=5)
-            combo.bind("<<ComboboxSelected>>", self.on_controller_change)
+            self._show_controllers(controllers)
         else:
-            tk.Label(self, text="No controllers detected").pack(pady=5)
+            self._no_controllers = tk.Label(self, text="No controllers detected")
+            self._no_controllers.pack(pady=5)
         
         # Mapping display
         tk.Label(self, text="\nN64 Button Mapping:").pack()
@@ -1531,17 +2316,80 @@ class ConfigWindow(tk.Toplevel):
                 self.controller_mgr.active_controller = c
                 break
     
+    def _show_controllers(self, controllers):
+        names = [c["name"] for c in controllers]
+        active = self.controller_mgr.active_controller
+        self.controller_var.set(active["name"] if active else names[0])
+        
+        if self._combo is not None:
+            self._combo.configure(values=names)
+            return
+        self._combo = ttk.Combobox(self, textvariable=self.controller_var, values=names, state="readonly", width=40)
+        if self._no_controllers is not None:
+            self._combo.pack(pady=5, after=self._no_controllers)
+            self._no_controllers.destroy()
+            self._no_controllers = None
+        else:
+            self._combo.pack(pady=5)
+        self._combo.bind("<<ComboboxSelected>>", self.on_controller_change)
+    
     def auto_detect(self):
-        self.controller_mgr.detect_all()
+        # Ignore repeated clicks while a scan is running or just finished
+        now = time.monotonic()
+        if self._scanning or now - self._last_scan < 0.5:
+            return
+        # The startup worker's own detect_all may still be scanning
+        if self.master._still_loading():
+            return
+        self._last_scan = now
+        self._scanning = True
+        threading.Thread(target=self._scan_worker, daemon=True).start()
+    
+    def _scan_worker(self):
+        controllers = []
+        try:
+            self.controller_mgr.invalidate()
+            controllers = self.controller_mgr.detect_all()
+        except Exception as e:
+            print(f"[Controller] Detection error: {e}")
+        try:
+            self.after(0, self._apply_scan, controllers)
+        except (tk.TclError, RuntimeError):
+            pass  # Window closed mid-scan
+    
+    def _apply_scan(self, controllers):
+        self._scanning = False
+        self._last_scan = time.monotonic()
+        if controllers:
+            self._show_controllers(controllers)
     
     def save_config(self):
         messagebox.showinfo("Saved", "Controller configuration saved")
         self.destroy()
 
 
+# Era i covers [_ERA_BOUNDS[i], _ERA_BOUNDS[i + 1])
+_ERA_BOUNDS = (1985, 1990, 1995, 2000, 2005, 2010, 2015, 2020, 2025)
+_ERA_NAMES = ("8-bit Era", "16-bit Era", "32/64-bit Era", "128-bit Era",
+              "HD Era", "Motion Era", "Current Gen", "Next Gen")
+
+@functools.lru_cache(maxsize=None)
+def get_era(year):
+    if not _ERA_BOUNDS[0] <= year < _ERA_BOUNDS[-1]:
+        return "Unknown"
+    return _ERA_NAMES[bisect.bisect_right(_ERA_BOUNDS, year) - 1]
+
+@functools.cache
+def _controller_rows():
+    """(name, year, era, type) for every controller, sorted by year"""
+    return tuple((data["name"], data["year"], get_era(data["year"]), data["ctype"])
+                 for data in sorted(_controller_db().values(), key=lambda d: d["year"]))
+
 class DatabaseWindow(tk.Toplevel):
     """Controller database viewer"""
     
+    PAGE_SIZE = 100
+    
     def __init__(self, parent):
         super().__init__(parent)
         self.title("Supported Controllers (1985-2024)")
@@ -1566,55 +2414,36 @@ class DatabaseWindow(tk.Toplevel):
         
         # Scrollbar
         scroll = ttk.Scrollbar(self, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=scroll.set)
+        tree.configure(yscrollcommand=self._on_tree_scroll)
+        self._tree = tree
+        self._scroll = scroll
+        
+        # Populate from database, sorted by year. Only the first page goes in
+        # up front (before the tree is packed, so it's laid out once); the
+        # rest is inserted as the view nears the bottom.
+        self._pending = _controller_rows()
+        self._loaded = 0
+        self._load_more()
         
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Populate from database
-        eras = {
-            range(1985, 1990): "8-bit Era",
-            range(1990, 1995): "16-bit Era",
-            range(1995, 2000): "32/64-bit Era",
-            range(2000, 2005): "128-bit Era",
-            range(2005, 2010): "HD Era",
-            range(2010, 2015): "Motion Era",
-            range(2015, 2020): "Current Gen",
-            range(2020, 2025): "Next Gen"
-        }
-        
-        def get_era(year):
-            for r, name in eras.items():
-                if year in r:
-                    return name
-            return "Unknown"
-        
-        # Sort by year
-        sorted_controllers = sorted(CONTROLLER_DATABASE.items(), key=lambda x: x[1]["year"])
-        
-        for key, data in sorted_controllers:
-            year = data["year"]
-            era = get_era(year)
-            
-            # Determine type
-            if "Switch" in data["name"] or "Joy-Con" in data["name"]:
-                ctype = "Nintendo"
-            elif "PlayStation" in data["name"] or "DualShock" in data["name"] or "DualSense" in data["name"]:
-                ctype = "Sony"
-            elif "Xbox" in data["name"]:
-                ctype = "Microsoft"
-            elif "8BitDo" in data["name"] or "Backbone" in data["name"] or "Razer" in data["name"]:
-                ctype = "Third Party"
-            elif "Sega" in data["name"] or "Genesis" in data["name"] or "Saturn" in data["name"]:
-                ctype = "Sega"
-            else:
-                ctype = "Other"
-            
-            tree.insert("", "end", values=(data["name"], year, era, ctype))
-        
         # Count label
-        count = len(CONTROLLER_DATABASE)
+        count = len(self._pending)
         tk.Label(self, text=f"Total: {count} controllers supported").pack(pady=5)
+    
+    def _load_more(self):
+        """Insert the next page of controller rows"""
+        end = min(self._loaded + self.PAGE_SIZE, len(self._pending))
+        insert = self._tree.insert
+        for row in self._pending[self._loaded:end]:
+            insert("", "end", values=row)
+        self._loaded = end
+    
+    def _on_tree_scroll(self, first, last):
+        self._scroll.set(first, last)
+        if float(last) > 0.9 and self._loaded < len(self._pending):
+            self._load_more()
 
 
 # =============================================================================
@@ -1633,7 +2462,7 @@ if __name__ == "__main__":
         else:
             print("[Mode] Native ARM64 → GLideN64 hardware renderer")
     
-    print(f"[Controllers] Database: {len(CONTROLLER_DATABASE)} controllers (1985-2024)")
+    print(f"[Controllers] Database: {len(_controller_db())} controllers (1985-2024)")
     
     app = CatsHLE()
     app.mainloop()
@@ -5,15 +5,29 @@ Auto-detects OS and installs RetroArch to standard system locations.
 """
 
 import os
+import json
 import platform
 import requests
 import zipfile
 import subprocess
+import queue
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import shutil
+import time
+import functools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Optional: httpx with HTTP/2 support (needs the h2 package); else requests
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
 # =============================================================================
 # OS DETECTION & PATH CONFIGURATION
 # =============================================================================
@@ -38,6 +52,8 @@ def get_platform_paths():
         - ra_file: Downloaded archive filename
         - core_url: Download URL for parallel_n64 core
         - core_ext: Core file extension
+        - core_path: Installed core library
+        - core_zip: Downloaded core archive
     """
     ra_version = "1.22.1"
     base_url = f"https://buildbot.libretro.com/stable/{ra_version}/"
@@ -116,6 +132,8 @@ def get_platform_paths():
         "ra_file": ra_file,
         "core_url": core_url,
         "core_ext": core_ext,
+        "core_path": cores_dir / f"parallel_n64_libretro{core_ext}",
+        "core_zip": config_dir / f"parallel_n64{core_ext}.zip",
     }
 
 
@@ -137,51 +155,267 @@ print(f"[Setup] Cores dir: {PATHS['cores_dir']}")
 # Default ROM directory
 ROM_DIR = HOME / "Documents" / "ROMs" / "N64"
 ROM_DIR.mkdir(parents=True, exist_ok=True)
+# Extension -> Format column text, and the size column formatter
+ROM_FORMATS = {".n64": "N64", ".z64": "Z64", ".v64": "V64"}
+ROM_EXTENSIONS = frozenset(ROM_FORMATS)
+_size_fmt = "{:.1f} MB".format
+
+# path -> [st_mtime_ns, st_size, row values], persisted between runs
+ROM_CACHE_FILE = PATHS["config_dir"] / "rom_cache.json"
+
+
+def load_rom_cache():
+    try:
+        return json.loads(ROM_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_rom_cache(cache):
+    tmp = ROM_CACHE_FILE.with_suffix(".json.tmp")
+    try:
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, ROM_CACHE_FILE)
+    except OSError as e:
+        print(f"[Warning] Could not save ROM cache: {e}")
 
 
 # =============================================================================
 # DOWNLOAD & INSTALLATION FUNCTIONS
 # =============================================================================
 
-def download(url, path, label="file"):
-    """Download file with progress indication and error handling."""
+# Network read size: fewer Python-level iterations per MB downloaded
+DOWNLOAD_CHUNK = 1 << 20
+
+DOWNLOAD_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+# Error statuses from the server (as opposed to a dropped connection)
+HTTP_STATUS_ERRORS = (requests.HTTPError,) + ((httpx.HTTPStatusError,) if httpx else ())
+
+
+@functools.lru_cache(maxsize=1)
+def _httpx_client():
+    # One client for every download: connections (and HTTP/2) are reused
+    return httpx.Client(http2=True, timeout=60.0, follow_redirects=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _requests_session():
+    # Same idea for the requests fallback: both buildbot downloads share a
+    # pooled keep-alive connection instead of a fresh TLS handshake each
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=3, backoff_factor=0.5))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@contextlib.contextmanager
+def _http_stream(url, headers=None):
+    """Yield (status code, headers, byte-chunk iterator) for a GET of url."""
+    if httpx is not None:
+        with _httpx_client().stream("GET", url, headers=headers) as r:
+            r.raise_for_status()
+            yield r.status_code, r.headers, r.iter_bytes(DOWNLOAD_CHUNK)
+    else:
+        with _requests_session().get(url, stream=True, timeout=60, headers=headers) as r:
+            r.raise_for_status()
+            yield r.status_code, r.headers, r.iter_content(chunk_size=DOWNLOAD_CHUNK)
+
+
+# Downloads are written in batches of about this many bytes. Where the OS
+# has writev() each batch is one vectored syscall on an unbuffered file;
+# elsewhere a buffered file of this size does the coalescing.
+WRITE_BATCH = 1 << 20
+HAS_WRITEV = hasattr(os, "writev")
+
+
+def _writev_all(fd, chunks, size):
+    """os.writev() the chunks, finishing any short write with os.write()."""
+    written = os.writev(fd, chunks)
+    if written < size:
+        rest = memoryview(b"".join(chunks))[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+
+
+def _write_behind(f, chunks, depth=8):
+    """
+    Write byte chunks to f from a helper thread, yielding each one back once
+    it is queued. The disk write of one chunk then overlaps the network read
+    of the next instead of stalling it. A write error is re-raised here.
+    
+    With HAS_WRITEV, f must be unbuffered (buffering=0).
+    """
+    pending = queue.Queue(depth)
+    error = []
+    
+    def writer():
+        try:
+            if HAS_WRITEV:
+                fd = f.fileno()
+                batch, size = [], 0
+                while (chunk := pending.get()) is not None:
+                    batch.append(chunk)
+                    size += len(chunk)
+                    if size >= WRITE_BATCH:
+                        _writev_all(fd, batch, size)
+                        batch, size = [], 0
+                if batch:
+                    _writev_all(fd, batch, size)
+            else:
+                while (chunk := pending.get()) is not None:
+                    f.write(chunk)
+        except BaseException as e:
+            error.append(e)
+            while pending.get() is not None:
+                pass
+    
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        for chunk in chunks:
+            if error:
+                break
+            pending.put(chunk)
+            yield chunk
+    finally:
+        pending.put(None)
+        thread.join()
+    if error:
+        raise error[0]
+
+
+# Console progress bar: one of 21 fixed strings, redrawn ~20 times/second
+_PROGRESS_BARS = ["█" * i + "░" * (20 - i) for i in range(21)]
+PROGRESS_INTERVAL = 0.05
+
+
+def download(url, path, label="file", progress=True):
+    """
+    Download file with progress indication and error handling.
+    
+    A failed transfer leaves its .tmp file behind, and the next call
+    resumes it with a Range request. If-Range carries the validator saved
+    from the first response, so a file that changed on the server in the
+    meantime comes back whole (200) and is fetched from scratch instead of
+    being spliced.
+    
+    progress=False skips the console bar, for a download that runs
+    alongside another one's; its messages then start on a fresh line
+    rather than landing on the end of the other bar.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
+    nl = "" if progress else "\n"
     
     if path.exists():
         print(f"[Download] {label} already exists, skipping")
         return True
     
-    print(f"[Download] Fetching {label}...")
     temp_path = path.with_suffix(path.suffix + ".tmp")
+    # ETag/Last-Modified of the response the .tmp file came from
+    validator_path = path.with_suffix(path.suffix + ".tmp.validator")
+    
+    offset = 0
+    request_headers = None
+    if temp_path.exists() and validator_path.exists():
+        offset = temp_path.stat().st_size
+        request_headers = {'Range': f'bytes={offset}-',
+                           'If-Range': validator_path.read_text().strip()}
+        print(f"{nl}[Download] Resuming {label} at {offset / (1024 * 1024):.1f} MB...")
+    else:
+        print(f"{nl}[Download] Fetching {label}...")
     
     try:
-        response = requests.get(url, stream=True, timeout=60)
-        response.raise_for_status()
-        
-        total = int(response.headers.get('content-length', 0))
-        downloaded = 0
-        
-        with open(temp_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=65536):
-                f.write(chunk)
-                downloaded += len(chunk)
-                if total:
-                    pct = (downloaded / total) * 100
-                    bar = "█" * int(pct // 5) + "░" * (20 - int(pct // 5))
-                    print(f"\r  [{bar}] {pct:5.1f}%", end="", flush=True)
-        
-        print()
+        with _http_stream(url, request_headers) as (status, headers, chunks):
+            resumed = bool(offset) and status == 206
+            if not resumed:
+                # Fresh start, or the server ignored/declined the range
+                offset = 0
+                etag = headers.get('etag', '')
+                validator = etag if etag and not etag.startswith('W/') else headers.get('last-modified', '')
+                if validator:
+                    validator_path.write_text(validator)
+                elif validator_path.exists():
+                    validator_path.unlink()
+            
+            length = int(headers.get('content-length', 0))
+            # total == 0 also means "no bar"
+            total = offset + length if length and progress else 0
+            downloaded = offset
+            last_print = 0.0
+            
+            def show_progress():
+                pct = min(downloaded / total * 100, 100.0)
+                print(f"\r  [{_PROGRESS_BARS[int(pct // 5)]}] {pct:5.1f}% {label:<20}", end="", flush=True)
+            
+            # Writes go out in ~1 MiB syscalls whatever size the chunks arrive in
+            buffering = 0 if HAS_WRITEV else WRITE_BATCH
+            with open(temp_path, 'ab' if resumed else 'wb', buffering=buffering) as f:
+                for chunk in _write_behind(f, chunks):
+                    downloaded += len(chunk)
+                    # Redraw at most every PROGRESS_INTERVAL, not once per chunk
+                    if total and (now := time.monotonic()) - last_print >= PROGRESS_INTERVAL:
+                        show_progress()
+                        last_print = now
+            
+            if total:
+                show_progress()
+        if progress:
+            print()
         temp_path.rename(path)
-        print(f"[Download] Saved to {path}")
+        if validator_path.exists():
+            validator_path.unlink()
+        print(f"{nl}[Download] Saved to {path}")
         return True
         
-    except requests.RequestException as e:
+    except DOWNLOAD_ERRORS as e:
         print(f"\n[Error] Download failed: {e}")
-        if temp_path.exists():
-            temp_path.unlink()
+        # Keep what arrived for the next attempt, unless the server itself
+        # refused (e.g. 416 for a stale range): then start over next time
+        if isinstance(e, HTTP_STATUS_ERRORS) or not validator_path.exists():
+            for stale in (temp_path, validator_path):
+                if stale.exists():
+                    stale.unlink()
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def _find_7z_tools():
+    """
+    (label, executable) for every 7-Zip binary found, in preference order.
+    Probed once: each shutil.which() walks the whole PATH.
+    """
+    tools = []
+    for cmd in ('7z', '7za', '7zr'):
+        exe = shutil.which(cmd)
+        if exe:
+            tools.append((cmd, exe))
+    
+    # Windows: try bundled 7z if available
+    if SYS_OS == "windows":
+        sz_paths = [
+            Path(os.environ.get("PROGRAMFILES", "C:/Program Files")) / "7-Zip" / "7z.exe",
+            Path(os.environ.get("PROGRAMFILES(X86)", "C:/Program Files (x86)")) / "7-Zip" / "7z.exe",
+        ]
+        for sz in sz_paths:
+            if sz.exists():
+                tools.append(("7-Zip", str(sz)))
+    return tuple(tools)
+
+
+def _run_7z(exe, archive_path, dest_dir):
+    """Run a 7-Zip binary's extract command with multithreaded decoding."""
+    args = [exe, 'x', str(archive_path), f'-o{dest_dir}', '-y']
+    result = subprocess.run(args + ['-mmt=on'], capture_output=True)
+    if result.returncode == 7:
+        # 7 is a command line error: a build that rejects -mmt on extract
+        result = subprocess.run(args, capture_output=True)
+    return result
+
+
 def extract_7z(archive_path, dest_dir):
     """Extract 7z archive using py7zr or system 7z."""
     print(f"[Extract] Unpacking {archive_path.name}...")
@@ -189,7 +423,15 @@ def extract_7z(archive_path, dest_dir):
     # Try py7zr first
     try:
         import py7zr
-        with py7zr.SevenZipFile(archive_path, mode='r') as z:
+        # extractall() is already a single pass over the archive header;
+        # a 1 MiB read block cuts py7zr's per-block loop for the many
+        # small files in the RetroArch archive
+        try:
+            archive = py7zr.SevenZipFile(archive_path, mode='r', blocksize=1 << 20)
+        except TypeError:
+            # Older py7zr without the blocksize option
+            archive = py7zr.SevenZipFile(archive_path, mode='r')
+        with archive as z:
             z.extractall(dest_dir)
         print(f"[Extract] Done (py7zr)")
         return True
@@ -198,38 +440,53 @@ def extract_7z(archive_path, dest_dir):
     except Exception as e:
         print(f"[Warning] py7zr failed: {e}")
     
-    # Try system 7z variants
-    for cmd in ['7z', '7za', '7zr']:
-        if shutil.which(cmd):
-            result = subprocess.run(
-                [cmd, 'x', str(archive_path), f'-o{dest_dir}', '-y'],
-                capture_output=True
-            )
-            if result.returncode == 0:
-                print(f"[Extract] Done ({cmd})")
-                return True
-    
-    # Windows: try bundled 7z if available
-    if SYS_OS == "windows":
-        sz_paths = [
-            Path(os.environ.get("PROGRAMFILES", "C:/Program Files")) / "7-Zip" / "7z.exe",
-            Path(os.environ.get("PROGRAMFILES(X86)", "C:/Program Files (x86)")) / "7-Zip" / "7z.exe",
-        ]
-        for sz in sz_paths:
-            if sz.exists():
-                result = subprocess.run(
-                    [str(sz), 'x', str(archive_path), f'-o{dest_dir}', '-y'],
-                    capture_output=True
-                )
-                if result.returncode == 0:
-                    print(f"[Extract] Done (7-Zip)")
-                    return True
+    # Try system 7z variants, then (on Windows) an installed 7-Zip
+    for name, exe in _find_7z_tools():
+        result = _run_7z(exe, archive_path, dest_dir)
+        if result.returncode == 0:
+            print(f"[Extract] Done ({name})")
+            return True
     
     print("[Error] No 7z extraction tool available!")
     print("        Install one of: py7zr (pip), 7-Zip, p7zip")
     return False
 
 
+def _hoist_contents(subdir, dest_dir):
+    """
+    Move every entry of subdir up into dest_dir, then remove subdir.
+    
+    subdir lives inside dest_dir, so each move is one os.replace() rename
+    (a file already at the destination is replaced in the same call)
+    rather than shutil.move()'s exists/unlink/copy-fallback checks.
+    dest_dir itself can't be swapped out wholesale: it also holds the
+    downloaded archive, cores/ and (on Windows) the config.
+    """
+    for item in subdir.iterdir():
+        dest = dest_dir / item.name
+        if dest.is_dir() and not dest.is_symlink():
+            shutil.rmtree(dest)
+        elif item.is_dir() and dest.exists():
+            dest.unlink()  # a directory can't replace a file
+        os.replace(item, dest)
+    try:
+        subdir.rmdir()
+    except OSError:
+        pass
+
+
+def _find_nested_retroarch(exe_name):
+    """Return the extracted RetroArch*/ subdir holding exe_name, or None."""
+    # scandir entries carry the d_type, so is_dir() needs no extra stat
+    with os.scandir(PATHS["retroarch_dir"]) as it:
+        for entry in it:
+            if (entry.name.startswith("RetroArch")
+                    and entry.is_dir(follow_symlinks=False)
+                    and os.path.exists(os.path.join(entry.path, exe_name))):
+                return Path(entry.path)
+    return None
+
+
 def install_retroarch_windows():
     """Install RetroArch on Windows."""
     if not download(PATHS["ra_url"], PATHS["ra_file"], "RetroArch"):
@@ -242,26 +499,10 @@ def install_retroarch_windows():
     # Find and move contents up if needed
     if not PATHS["ra_exe"].exists():
         print("[Install] Fixing directory structure...")
-        for subdir in PATHS["retroarch_dir"].iterdir():
-            if subdir.is_dir() and subdir.name.startswith("RetroArch"):
-                # Found the nested directory, move contents up
-                nested_exe = subdir / "retroarch.exe"
-                if nested_exe.exists():
-                    print(f"[Install] Moving files from {subdir.name}/...")
-                    for item in subdir.iterdir():
-                        dest = PATHS["retroarch_dir"] / item.name
-                        if dest.exists():
-                            if dest.is_dir():
-                                shutil.rmtree(dest)
-                            else:
-                                dest.unlink()
-                        shutil.move(str(item), str(dest))
-                    # Remove empty subdirectory
-                    try:
-                        subdir.rmdir()
-                    except OSError:
-                        pass
-                    break
+        subdir = _find_nested_retroarch("retroarch.exe")
+        if subdir is not None:
+            print(f"[Install] Moving files from {subdir.name}/...")
+            _hoist_contents(subdir, PATHS["retroarch_dir"])
     
     return PATHS["ra_exe"].exists()
 
@@ -277,24 +518,10 @@ def install_retroarch_linux():
     # RetroArch 7z may extract to a subdirectory - fix if needed
     if not PATHS["ra_exe"].exists():
         print("[Install] Fixing directory structure...")
-        for subdir in PATHS["retroarch_dir"].iterdir():
-            if subdir.is_dir() and subdir.name.startswith("RetroArch"):
-                nested_exe = subdir / "retroarch"
-                if nested_exe.exists():
-                    print(f"[Install] Moving files from {subdir.name}/...")
-                    for item in subdir.iterdir():
-                        dest = PATHS["retroarch_dir"] / item.name
-                        if dest.exists():
-                            if dest.is_dir():
-                                shutil.rmtree(dest)
-                            else:
-                                dest.unlink()
-                        shutil.move(str(item), str(dest))
-                    try:
-                        subdir.rmdir()
-                    except OSError:
-                        pass
-                    break
+        subdir = _find_nested_retroarch("retroarch")
+        if subdir is not None:
+            print(f"[Install] Moving files from {subdir.name}/...")
+            _hoist_contents(subdir, PATHS["retroarch_dir"])
     
     # Make executable
     if PATHS["ra_exe"].exists():
@@ -303,6 +530,38 @@ def install_retroarch_linux():
     return PATHS["ra_exe"].exists()
 
 
+def fast_copytree(src, dst):
+    """
+    Copy a directory tree, copying files on a thread pool.
+    
+    Each file goes through shutil.copy: the data is copied in-kernel
+    (fcopyfile on macOS, sendfile on Linux) with the GIL released, and only
+    the mode bits are kept, not copy2's timestamps/xattrs. Keeping symlinks
+    as links avoids copying framework Versions/ trees twice.
+    """
+    src, dst = str(src), str(dst)
+    workers = min(8, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        jobs = []
+        for root, dirs, files in os.walk(src):
+            out = os.path.join(dst, os.path.relpath(root, src))
+            os.makedirs(out, exist_ok=True)
+            # os.walk lists symlinked dirs but doesn't descend into them
+            for name in dirs:
+                s_path = os.path.join(root, name)
+                if os.path.islink(s_path):
+                    os.symlink(os.readlink(s_path), os.path.join(out, name))
+            for name in files:
+                s_path = os.path.join(root, name)
+                d_path = os.path.join(out, name)
+                if os.path.islink(s_path):
+                    os.symlink(os.readlink(s_path), d_path)
+                else:
+                    jobs.append(ex.submit(shutil.copy, s_path, d_path))
+        for job in jobs:
+            job.result()
+
+
 def install_retroarch_macos():
     """Install RetroArch on macOS."""
     if not download(PATHS["ra_url"], PATHS["ra_file"], "RetroArch"):
@@ -334,7 +593,7 @@ def install_retroarch_macos():
         print(f"[Install] Copying to {app_dst}...")
         if app_dst.exists():
             shutil.rmtree(app_dst)
-        shutil.copytree(app_src, app_dst)
+        fast_copytree(app_src, app_dst)
         
         # Make executable
         if PATHS["ra_exe"].exists():
@@ -366,23 +625,71 @@ def install_retroarch():
     return False
 
 
+def extract_zip(zip_path, dest_dir):
+    """
+    Extract a zip, one member per worker thread for multi-file archives.
+    Every worker opens its own ZipFile, since a shared handle's file
+    position isn't thread-safe.
+    
+    ZipFile.extract() checks for a member's parent dir and then creates
+    it, which races between workers sharing a new dir, so every dir is
+    made up front on this thread and the pool only sees file members.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as z:
+        infos = z.infolist()
+        if len(infos) <= 1:
+            z.extractall(dest_dir)
+            return
+    
+    names = []
+    for info in infos:
+        # The same path cleanup ZipFile.extract() applies to member names
+        arcname = os.path.splitdrive(info.filename.replace('/', os.path.sep))[1]
+        parts = [p for p in arcname.split(os.path.sep) if p not in ('', os.path.curdir, os.path.pardir)]
+        if info.is_dir():
+            os.makedirs(os.path.join(dest_dir, *parts), exist_ok=True)
+        else:
+            if len(parts) > 1:
+                os.makedirs(os.path.join(dest_dir, *parts[:-1]), exist_ok=True)
+            names.append(info.filename)
+    if not names:
+        return
+    
+    local = threading.local()
+    handles = []
+    
+    def extract_one(name):
+        if not hasattr(local, "zip"):
+            local.zip = zipfile.ZipFile(zip_path, 'r')
+            handles.append(local.zip)
+        local.zip.extract(name, dest_dir)
+    
+    workers = min(len(names), os.cpu_count() or 1)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            # list() so the first failure is raised here
+            list(ex.map(extract_one, names))
+    finally:
+        for handle in handles:
+            handle.close()
+
+
 def install_core():
     """Download and extract parallel_n64 core."""
-    core_path = PATHS["cores_dir"] / f"parallel_n64_libretro{PATHS['core_ext']}"
+    core_path = PATHS["core_path"]
     
     if core_path.exists():
         print(f"[Setup] Core already installed at {core_path}")
         return True
     
-    core_zip = PATHS["config_dir"] / f"parallel_n64{PATHS['core_ext']}.zip"
+    core_zip = PATHS["core_zip"]
     
     if not download(PATHS["core_url"], core_zip, "parallel_n64 core"):
         return False
     
     print(f"[Install] Extracting core to {PATHS['cores_dir']}...")
     try:
-        with zipfile.ZipFile(core_zip, 'r') as z:
-            z.extractall(PATHS["cores_dir"])
+        extract_zip(core_zip, PATHS["cores_dir"])
         
         # Make executable on Unix
         if SYS_OS != "windows" and core_path.exists():
@@ -395,6 +702,26 @@ def install_core():
         return False
 
 
+def install_all():
+    """
+    Install RetroArch and the core. Returns (retroarch_ok, core_ok).
+    
+    RetroArch installs while the core zip downloads on a second thread.
+    The core is only extracted once RetroArch is done: on Windows/Linux
+    cores/ is inside retroarch_dir, which the RetroArch install rearranges.
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        ra_job = ex.submit(install_retroarch)
+        if not PATHS["core_path"].exists():
+            # No bar of its own: only RetroArch's redraws the progress line
+            ex.submit(download, PATHS["core_url"], PATHS["core_zip"], "parallel_n64 core",
+                      progress=False)
+        ra_ok = ra_job.result()
+    # Finds the zip already fetched (or retries a failed fetch)
+    core_ok = install_core()
+    return ra_ok, core_ok
+
+
 # =============================================================================
 # GUI APPLICATION
 # =============================================================================
@@ -418,6 +745,10 @@ class PJ64Revamped(tk.Tk):
         
         self.rom_dir = ROM_DIR
         self.roms = {}  # iid -> Path
+        self._installing = False
+        self._rom_cache = load_rom_cache()
+        self._rom_cache_dirty = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self._setup_styles()
         self._create_menu()
@@ -452,7 +783,7 @@ class PJ64Revamped(tk.Tk):
         filemenu.add_command(label="Open ROM...", command=self.open_rom, accelerator="Ctrl+O")
         filemenu.add_command(label="Refresh ROM List", command=self.load_roms, accelerator="F5")
         filemenu.add_separator()
-        filemenu.add_command(label="Exit", command=self.quit, accelerator="Alt+F4")
+        filemenu.add_command(label="Exit", command=self._on_close, accelerator="Alt+F4")
         menubar.add_cascade(label="File", menu=filemenu)
         
         # Options menu
@@ -528,38 +859,112 @@ class PJ64Revamped(tk.Tk):
         self.rom_list.bind("<Return>", self.run_selected_rom)
         
     def load_roms(self):
-        self.rom_list.delete(*self.rom_list.get_children())
-        self.roms.clear()
-        
-        extensions = ['*.n64', '*.N64', '*.z64', '*.Z64', '*.v64', '*.V64']
-        rom_files = []
-        for ext in extensions:
-            rom_files.extend(self.rom_dir.glob(ext))
+        # One directory pass; each name appears once, so no dedupe needed,
+        # and DirEntry.stat() reuses what the scan already fetched
+        found = []
+        try:
+            with os.scandir(self.rom_dir) as it:
+                for entry in it:
+                    if os.path.splitext(entry.name)[1].lower() in ROM_EXTENSIONS and entry.is_file():
+                        found.append(entry)
+        except OSError:
+            pass
         
-        # Dedupe (case-insensitive filesystems)
+        # Build every row first, then touch the widget once. Rows for files
+        # whose mtime and size still match the sidecar cache are reused.
+        cache = self._rom_cache
         seen = set()
-        unique = []
-        for rom in rom_files:
-            key = str(rom).lower()
-            if key not in seen:
-                seen.add(key)
-                unique.append(rom)
-        
-        for rom in sorted(unique, key=lambda r: r.stem.lower()):
+        rows = []
+        for entry in sorted(found, key=lambda e: os.path.splitext(e.name)[0].lower()):
             try:
-                size = rom.stat().st_size / (1024 * 1024)
-                fmt = rom.suffix.upper().replace(".", "")
-                iid = self.rom_list.insert("", "end",
-                                           values=(rom.stem, rom.name, f"{size:.1f} MB", fmt))
-                self.roms[iid] = rom
+                st = entry.stat()
             except OSError:
-                pass
+                continue
+            path = entry.path
+            seen.add(path)
+            cached = cache.get(path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                values = tuple(cached[2])
+            else:
+                stem, ext = os.path.splitext(entry.name)
+                values = (stem, entry.name, _size_fmt(st.st_size / (1024 * 1024)),
+                          ROM_FORMATS[ext.lower()])
+                cache[path] = [st.st_mtime_ns, st.st_size, values]
+                self._rom_cache_dirty = True
+            rows.append((values, Path(path)))
+        
+        # Forget files that have left this folder
+        rom_dir = str(self.rom_dir)
+        for path in [p for p in cache if os.path.dirname(p) == rom_dir and p not in seen]:
+            del cache[path]
+            self._rom_cache_dirty = True
+        
+        # Unmapped while refilling, so the tree lays out once at the end
+        # rather than after every insert
+        self.rom_list.grid_remove()
+        try:
+            self.rom_list.delete(*self.rom_list.get_children())
+            self.roms.clear()
+            insert = self.rom_list.insert
+            for values, rom in rows:
+                self.roms[insert("", "end", values=values)] = rom
+        finally:
+            self.rom_list.grid()
         
         self.update_status()
         
+    def _on_close(self):
+        # Quitting kills the install worker mid-copy/extract, which can leave
+        # a RetroArch that looks installed on the next run but isn't whole
+        if self._installing and not messagebox.askyesno(
+                "Quit",
+                "RetroArch and the core are still installing.\n"
+                "Quitting now can leave a broken install. Quit anyway?"):
+            return
+        if self._rom_cache_dirty:
+            save_rom_cache(self._rom_cache)
+        self.destroy()
+        
     def update_status(self):
         count = len(self.roms)
-        self.statusbar.config(text=f"{count} ROM{'s' if count != 1 else ''} | {self.rom_dir}")
+        text = f"{count} ROM{'s' if count != 1 else ''} | {self.rom_dir}"
+        if self._installing:
+            text += " | Installing RetroArch and core..."
+        self.statusbar.config(text=text)
+        
+    def start_install(self):
+        """Run install_all() on a worker thread, reporting back via after()."""
+        self._installing = True
+        self.update_status()
+        threading.Thread(target=self._install_worker, daemon=True).start()
+        
+    def _install_worker(self):
+        try:
+            ra_ok, core_ok = install_all()
+        except Exception as e:
+            print(f"[Error] Installation failed: {e}")
+            ra_ok = core_ok = False
+        self.after(0, self._install_done, ra_ok, core_ok)
+        
+    def _install_done(self, ra_ok, core_ok):
+        self._installing = False
+        self.update_status()
+        
+        problems = []
+        if not ra_ok:
+            print("\n[Error] RetroArch installation failed!")
+            print("You may need to install manually or check your internet connection.")
+            problems.append("RetroArch installation failed.\n"
+                            "You may need to install manually or check your internet connection.")
+        if not core_ok:
+            print("\n[Error] Core installation failed!")
+            print("You can download cores manually via RetroArch's Online Updater.")
+            problems.append("Core installation failed.\n"
+                            "You can download cores manually via RetroArch's Online Updater.")
+        if problems:
+            messagebox.showwarning("Setup", "\n\n".join(problems))
+        else:
+            print("\n[Ready] RetroArch and core installed\n")
         
     def open_rom(self):
         rom_path = filedialog.askopenfilename(
@@ -581,12 +986,21 @@ class PJ64Revamped(tk.Tk):
         else:
             messagebox.showerror("Error", "ROM file not found. Try refreshing.")
             
+    def _install_busy(self):
+        """Tell the user to wait, and return True, while installing."""
+        if self._installing:
+            messagebox.showinfo("Please Wait", "RetroArch and the core are still installing.")
+        return self._installing
+        
     def run_rom_path(self, rom_path):
+        if self._install_busy():
+            return
+        
         if not PATHS["ra_exe"].exists():
             messagebox.showerror("Error", f"RetroArch not found:\n{PATHS['ra_exe']}")
             return
         
-        core_path = PATHS["cores_dir"] / f"parallel_n64_libretro{PATHS['core_ext']}"
+        core_path = PATHS["core_path"]
         if not core_path.exists():
             messagebox.showerror("Error", f"Core not found:\n{core_path}")
             return
@@ -620,6 +1034,9 @@ class PJ64Revamped(tk.Tk):
             subprocess.Popen(['xdg-open', str(path)])
             
     def launch_retroarch(self):
+        if self._install_busy():
+            return
+        
         if not PATHS["ra_exe"].exists():
             messagebox.showerror("Error", "RetroArch not installed!")
             return
@@ -659,21 +1076,9 @@ def main():
     print("=" * 60)
     print()
     
-    # Install RetroArch
-    if not install_retroarch():
-        print("\n[Error] RetroArch installation failed!")
-        print("You may need to install manually or check your internet connection.")
-        input("\nPress Enter to continue anyway...")
-    
-    # Install core
-    if not install_core():
-        print("\n[Error] Core installation failed!")
-        print("You can download cores manually via RetroArch's Online Updater.")
-        input("\nPress Enter to continue anyway...")
-    
-    print("\n[Ready] Launching GUI...\n")
-    
+    # Open the window straight away; installs run behind it
     app = PJ64Revamped()
+    app.start_install()
     app.mainloop()
 
 